@@ -12,7 +12,7 @@ from sqlalchemy.orm import selectinload
 from guild_portal.deps import get_current_player, get_db
 from sv_common.auth.invite_codes import consume_invite_code, validate_invite_code
 from sv_common.auth.jwt import create_access_token
-from sv_common.auth.passwords import hash_password, verify_password
+from sv_common.auth.passwords import hash_password_async, verify_password_async
 from sv_common.db.models import Player, User
 
 logger = logging.getLogger(__name__)
@@ -92,7 +92,7 @@ async def register(body: RegisterBody, db: AsyncSession = Depends(get_db)):
         )
 
     # Create the User record
-    user = User(email=login_email, password_hash=hash_password(body.password))
+    user = User(email=login_email, password_hash=await hash_password_async(body.password))
     db.add(user)
     await db.flush()
 
@@ -123,7 +123,7 @@ async def login(body: LoginBody, db: AsyncSession = Depends(get_db)):
     )
     user = user_result.scalar_one_or_none()
 
-    if user is None or not verify_password(body.password, user.password_hash):
+    if user is None or not await verify_password_async(body.password, user.password_hash):
         raise HTTPException(status_code=401, detail="Invalid credentials.")
 
     if not user.is_active:
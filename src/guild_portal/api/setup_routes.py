@@ -11,7 +11,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from guild_portal.config import get_settings
 from guild_portal.deps import get_db
-from sv_common.auth.passwords import hash_password
+from sv_common.auth.passwords import hash_password_async
 from sv_common.config_cache import get_site_config, set_site_config
 from sv_common.crypto import decrypt_secret, encrypt_secret
 from sv_common.db.models import DiscordConfig, GuildRank, Player, RankWowMapping, SiteConfig, User
@@ -567,7 +567,7 @@ async def create_admin(body: CreateAdminBody, db: AsyncSession = Depends(get_db)
     if gl_rank is None:
         raise HTTPException(status_code=500, detail="No ranks configured. Run database setup first.")
 
-    user = User(email=login_email, password_hash=hash_password(body.password))
+    user = User(email=login_email, password_hash=await hash_password_async(body.password))
     db.add(user)
     await db.flush()
 
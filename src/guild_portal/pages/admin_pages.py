@@ -2128,6 +2128,11 @@ async def admin_add_note_alias(
     return JSONResponse({"ok": True, "alias": {"id": row["id"], "alias": row["alias"], "source": row["source"]}})
 
 
+def _coverage_pct(matched: int, total: int) -> float:
+    """Percentage to one decimal place; 0.0 when there is nothing to cover."""
+    return round(matched / total * 100, 1) if total else 0.0
+
+
 @router.get("/matching/coverage")
 async def admin_matching_coverage(
     request: Request,
@@ -2233,9 +2238,6 @@ async def admin_matching_coverage(
             for r in unmatched_discord_rows
         ]
 
-    def pct(matched: int, total: int) -> float:
-        return round(matched / total * 100, 1) if total else 0.0
-
     unmatched_chars_count = (total_chars or 0) - (matched_chars or 0)
     unmatched_discord_count = (total_discord or 0) - (matched_discord or 0)
     players_without_discord = (total_players or 0) - (players_with_discord or 0)
@@ -2247,15 +2249,15 @@ async def admin_matching_coverage(
                 "total_characters": total_chars or 0,
                 "matched_characters": matched_chars or 0,
                 "unmatched_characters": unmatched_chars_count,
-                "character_coverage_pct": pct(matched_chars or 0, total_chars or 0),
+                "character_coverage_pct": _coverage_pct(matched_chars or 0, total_chars or 0),
                 "total_discord_users": total_discord or 0,
                 "matched_discord_users": matched_discord or 0,
                 "unmatched_discord_users": unmatched_discord_count,
-                "discord_coverage_pct": pct(matched_discord or 0, total_discord or 0),
+                "discord_coverage_pct": _coverage_pct(matched_discord or 0, total_discord or 0),
                 "total_players": total_players or 0,
                 "players_with_discord": players_with_discord or 0,
                 "players_without_discord": players_without_discord,
-                "discord_link_pct": pct(players_with_discord or 0, total_players or 0),
+                "discord_link_pct": _coverage_pct(players_with_discord or 0, total_players or 0),
             },
             "by_link_source": by_link_source,
             "by_confidence": by_confidence,
@@ -2787,9 +2789,9 @@ async def admin_reset_user_password(
     if not u:
         return JSONResponse({"ok": False, "error": "User not found"}, status_code=404)
 
-    from sv_common.auth.passwords import generate_temp_password, hash_password
+    from sv_common.auth.passwords import generate_temp_password, hash_password_async
     temp_pw = generate_temp_password()
-    u.password_hash = hash_password(temp_pw)
+    u.password_hash = await hash_password_async(temp_pw)
     await db.commit()
     return JSONResponse({"ok": True, "data": {"temp_password": temp_pw}})
 
@@ -73,7 +73,7 @@ async def login_post(
     next: str = "/",
     db: AsyncSession = Depends(get_db),
 ):
-    from sv_common.auth.passwords import verify_password
+    from sv_common.auth.passwords import verify_password_async
     from sv_common.auth.jwt import create_access_token
 
     def render_error(msg: str):
@@ -101,7 +101,7 @@ async def login_post(
     if not user.is_active:
         return render_error("Account is inactive. Contact an officer.")
 
-    if not verify_password(password, user.password_hash):
+    if not await verify_password_async(password, user.password_hash):
         return render_error("Invalid username or password.")
 
     # Find the player linked to this user
@@ -159,7 +159,7 @@ async def register_post(
     password2: str = Form(...),
     db: AsyncSession = Depends(get_db),
 ):
-    from sv_common.auth.passwords import hash_password
+    from sv_common.auth.passwords import hash_password_async
     from sv_common.auth.jwt import create_access_token
     from datetime import datetime, timezone
 
@@ -215,7 +215,7 @@ async def register_post(
         return render_error("An account with this Discord username already exists.")
 
     # Create the user account
-    user = User(email=login_email, password_hash=hash_password(password), is_active=True)
+    user = User(email=login_email, password_hash=await hash_password_async(password), is_active=True)
     db.add(user)
     await db.flush()
 
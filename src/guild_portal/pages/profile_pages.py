@@ -16,10 +16,10 @@ from guild_portal.services import campaign_service
 from guild_portal.services.availability_service import (
     clear_player_availability,
     get_player_availability,
-    set_player_availability,
+    set_player_availability_bulk,
 )
 from guild_portal.templating import templates
-from sv_common.auth.passwords import hash_password, verify_password
+from sv_common.auth.passwords import hash_password_async, verify_password_async
 from sv_common.db.models import (
     BattlenetAccount,
     Player,
@@ -369,6 +369,7 @@ async def profile_update_availability(
         # First clear all existing availability rows for this player
         await clear_player_availability(db, current_member.id)
 
+        entries: list[dict] = []
         for day in range(7):
             available_flag = form.get(f"day_{day}_available")
             if not available_flag:
@@ -399,13 +400,15 @@ async def profile_update_availability(
                     status_code=302,
                 )
 
-            await set_player_availability(
-                db,
-                player_id=current_member.id,
-                day_of_week=day,
-                earliest_start=earliest_start,
-                available_hours=available_hours,
+            entries.append(
+                {
+                    "day_of_week": day,
+                    "earliest_start": earliest_start,
+                    "available_hours": available_hours,
+                }
             )
+
+        await set_player_availability_bulk(db, current_member.id, entries)
     except ValueError as exc:
         return RedirectResponse(
             url=f"/profile?error={str(exc).replace(' ', '+')}",
@@ -449,10 +452,10 @@ async def profile_update_password(
     if user is None:
         return RedirectResponse(url="/profile?error=Account+not+found", status_code=302)
 
-    if not verify_password(current_password, user.password_hash):
+    if not await verify_password_async(current_password, user.password_hash):
         return RedirectResponse(url="/profile?error=Current+password+is+incorrect", status_code=302)
 
-    user.password_hash = hash_password(new_password)
+    user.password_hash = await hash_password_async(new_password)
     try:
         await db.flush()
     except Exception as exc:
@@ -3,9 +3,9 @@
 from datetime import time
 from decimal import Decimal
 
-from sqlalchemy import select
+from sqlalchemy import func, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
 
 from sv_common.db.models import GuildRank, Player, PlayerAvailability
 
@@ -22,6 +22,62 @@ async def get_player_availability(
     return list(result.scalars().all())
 
 
+def _validate_entry(day_of_week: int, available_hours: Decimal) -> None:
+    if not (0 <= day_of_week <= 6):
+        raise ValueError(f"day_of_week must be 0–6, got {day_of_week}")
+    if not (Decimal("0") < Decimal(str(available_hours)) <= Decimal("16")):
+        raise ValueError(f"available_hours must be >0 and <=16, got {available_hours}")
+
+
+async def set_player_availability_bulk(
+    db: AsyncSession,
+    player_id: int,
+    entries: list[dict],
+) -> list[PlayerAvailability]:
+    """Upsert several days' availability for a player in one statement.
+
+    entries: [{"day_of_week": int, "earliest_start": time,
+               "available_hours": Decimal}, ...]
+    Every entry is validated before touching the DB, including that no
+    day_of_week repeats (ON CONFLICT cannot update one row twice); the rows
+    are then written with a single INSERT ... ON CONFLICT (player_id,
+    day_of_week) DO UPDATE. Returns the upserted rows ordered by day_of_week.
+    """
+    if not entries:
+        return []
+    seen_days: set[int] = set()
+    for entry in entries:
+        day = entry["day_of_week"]
+        _validate_entry(day, entry["available_hours"])
+        if day in seen_days:
+            raise ValueError(f"day_of_week {day} given more than once")
+        seen_days.add(day)
+
+    stmt = pg_insert(PlayerAvailability).values(
+        [
+            {
+                "player_id": player_id,
+                "day_of_week": entry["day_of_week"],
+                "earliest_start": entry["earliest_start"],
+                "available_hours": entry["available_hours"],
+            }
+            for entry in entries
+        ]
+    )
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[PlayerAvailability.player_id, PlayerAvailability.day_of_week],
+        set_={
+            "earliest_start": stmt.excluded.earliest_start,
+            "available_hours": stmt.excluded.available_hours,
+            "updated_at": func.now(),
+        },
+    ).returning(PlayerAvailability)
+    result = await db.scalars(
+        stmt, execution_options={"populate_existing": True}
+    )
+    return sorted(result.all(), key=lambda row: row.day_of_week)
+
+
 async def set_player_availability(
     db: AsyncSession,
     player_id: int,
@@ -35,36 +91,18 @@ async def set_player_availability(
     earliest_start: local time in player's timezone (stored as-is).
     available_hours: must be between 0 (exclusive) and 16 (inclusive).
     """
-    if not (0 <= day_of_week <= 6):
-        raise ValueError(f"day_of_week must be 0–6, got {day_of_week}")
-    if not (Decimal("0") < Decimal(str(available_hours)) <= Decimal("16")):
-        raise ValueError(f"available_hours must be >0 and <=16, got {available_hours}")
-
-    result = await db.execute(
-        select(PlayerAvailability).where(
-            PlayerAvailability.player_id == player_id,
-            PlayerAvailability.day_of_week == day_of_week,
-        )
-    )
-    existing = result.scalar_one_or_none()
-
-    if existing:
-        existing.earliest_start = earliest_start
-        existing.available_hours = available_hours
-        await db.flush()
-        await db.refresh(existing)
-        return existing
-
-    row = PlayerAvailability(
-        player_id=player_id,
-        day_of_week=day_of_week,
-        earliest_start=earliest_start,
-        available_hours=available_hours,
+    rows = await set_player_availability_bulk(
+        db,
+        player_id,
+        [
+            {
+                "day_of_week": day_of_week,
+                "earliest_start": earliest_start,
+                "available_hours": available_hours,
+            }
+        ],
     )
-    db.add(row)
-    await db.flush()
-    await db.refresh(row)
-    return row
+    return rows[0]
 
 
 async def clear_player_availability(db: AsyncSession, player_id: int) -> int:
@@ -89,26 +127,16 @@ async def get_all_availability_for_day(
       scheduling_weight (from guild rank, 0 if no rank set).
     """
     result = await db.execute(
-        select(PlayerAvailability)
-        .options(
-            selectinload(PlayerAvailability.player).selectinload(Player.guild_rank)
+        select(
+            PlayerAvailability.player_id,
+            Player.display_name,
+            PlayerAvailability.day_of_week,
+            PlayerAvailability.earliest_start,
+            PlayerAvailability.available_hours,
+            func.coalesce(GuildRank.scheduling_weight, 0).label("scheduling_weight"),
         )
+        .join(Player, PlayerAvailability.player_id == Player.id)
+        .outerjoin(GuildRank, Player.guild_rank_id == GuildRank.id)
         .where(PlayerAvailability.day_of_week == day_of_week)
     )
-    rows = list(result.scalars().all())
-
-    return [
-        {
-            "player_id": row.player_id,
-            "display_name": row.player.display_name,
-            "day_of_week": row.day_of_week,
-            "earliest_start": row.earliest_start,
-            "available_hours": row.available_hours,
-            "scheduling_weight": (
-                row.player.guild_rank.scheduling_weight
-                if row.player.guild_rank
-                else 0
-            ),
-        }
-        for row in rows
-    ]
+    return [dict(row) for row in result.mappings().all()]
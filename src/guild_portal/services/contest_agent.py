@@ -8,6 +8,8 @@ messages to the campaign's Discord channel.
 import asyncio
 import logging
 import random
+from collections import defaultdict
+from collections.abc import Set
 from datetime import datetime, timedelta, timezone
 from typing import Optional
 
@@ -30,9 +32,9 @@ logger = logging.getLogger(__name__)
 # Chattiness configuration
 # ---------------------------------------------------------------------------
 
-CHATTINESS_TRIGGERS: dict[str, set[str]] = {
-    "quiet": {"campaign_launch", "campaign_closed"},
-    "normal": {
+CHATTINESS_TRIGGERS: dict[str, frozenset[str]] = {
+    "quiet": frozenset({"campaign_launch", "campaign_closed"}),
+    "normal": frozenset({
         "campaign_launch",
         "first_vote",
         "milestone_50",
@@ -40,8 +42,8 @@ CHATTINESS_TRIGGERS: dict[str, set[str]] = {
         "last_call",
         "all_voted",
         "campaign_closed",
-    },
-    "hype": {
+    }),
+    "hype": frozenset({
         "campaign_launch",
         "first_vote",
         "lead_change",
@@ -52,7 +54,7 @@ CHATTINESS_TRIGGERS: dict[str, set[str]] = {
         "last_call",
         "all_voted",
         "campaign_closed",
-    },
+    }),
 }
 
 # Priority order — most exciting first
@@ -191,7 +193,7 @@ _NO_SCORE = "0"
 # ---------------------------------------------------------------------------
 
 
-def get_allowed_events(chattiness: str) -> set[str]:
+def get_allowed_events(chattiness: str) -> frozenset[str]:
     """Return the set of event types active for a given chattiness level."""
     return CHATTINESS_TRIGGERS.get(chattiness, CHATTINESS_TRIGGERS["normal"])
 
@@ -200,7 +202,7 @@ def detect_milestone(
     campaign_status: str,
     stats: dict,
     time_remaining_hours: float,
-    logged_events: set[str],
+    logged_events: Set[str],
     chattiness: str,
     current_leader_id: Optional[int] = None,
     previous_leader_id: Optional[int] = None,
@@ -276,11 +278,8 @@ def generate_message(event_type: str, data: dict) -> str:
     pool = TEMPLATES.get(event_type, [])
     if not pool:
         return f"[{event_type}] {data}"
-    template = random.choice(pool)
-    try:
-        return template.format(**data)
-    except KeyError:
-        return template
+    # Missing keys render as "" rather than raising mid-format.
+    return random.choice(pool).format_map(defaultdict(str, data))
 
 
 # ---------------------------------------------------------------------------
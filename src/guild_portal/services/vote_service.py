@@ -252,29 +252,42 @@ async def calculate_results(
 
 
 async def get_results(db: AsyncSession, campaign_id: int) -> list[dict]:
-    """Return sorted results with entry info for display."""
-    results_q = await db.execute(
-        select(CampaignResult)
-        .options(selectinload(CampaignResult.entry))
+    """Return sorted results with entry info for display.
+
+    One results/entries JOIN; a campaign has one result row per entry, so
+    the rows are fetched in a single buffered execute.
+    """
+    result = await db.execute(
+        select(
+            CampaignEntry.id.label("entry_id"),
+            CampaignEntry.name,
+            CampaignEntry.image_url,
+            CampaignEntry.description,
+            CampaignResult.first_place_count,
+            CampaignResult.second_place_count,
+            CampaignResult.third_place_count,
+            CampaignResult.weighted_score,
+            CampaignResult.final_rank,
+        )
+        .join(CampaignEntry, CampaignResult.entry_id == CampaignEntry.id)
         .where(CampaignResult.campaign_id == campaign_id)
         .order_by(CampaignResult.final_rank)
     )
-    results = results_q.scalars().all()
     return [
         {
             "entry": {
-                "id": r.entry.id,
-                "name": r.entry.name,
-                "image_url": r.entry.image_url,
-                "description": r.entry.description,
+                "id": r["entry_id"],
+                "name": r["name"],
+                "image_url": r["image_url"],
+                "description": r["description"],
             },
-            "first_place_count": r.first_place_count,
-            "second_place_count": r.second_place_count,
-            "third_place_count": r.third_place_count,
-            "weighted_score": r.weighted_score,
-            "final_rank": r.final_rank,
+            "first_place_count": r["first_place_count"],
+            "second_place_count": r["second_place_count"],
+            "third_place_count": r["third_place_count"],
+            "weighted_score": r["weighted_score"],
+            "final_rank": r["final_rank"],
         }
-        for r in results
+        for r in result.mappings()
     ]
 
 
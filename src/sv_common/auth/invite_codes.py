@@ -12,9 +12,24 @@ from sv_common.db.models import InviteCode
 _CHARSET = "ABCDEFGHJKMNPQRSTUVWXYZ23456789"
 _CODE_LENGTH = 8
 
+# Invite codes gate registration, so draw from the OS CSPRNG. choices() picks
+# all 8 chars in one call; the 31-char charset rules out a byte % len mapping
+# (it would bias the first few characters).
+_RNG = random.SystemRandom()
+
+# Deletes every accepted character, so a well-formed code translates to "".
+# "L" stays accepted: onboarding codes issued before the bot generators
+# switched to _CHARSET may still contain it.
+_STRIP_CHARSET = str.maketrans("", "", _CHARSET + "L")
+
 
 def _generate_code() -> str:
-    return "".join(random.choices(_CHARSET, k=_CODE_LENGTH))
+    return "".join(_RNG.choices(_CHARSET, k=_CODE_LENGTH))
+
+
+def _is_well_formed(code: str) -> bool:
+    """True if code has the generated length and only charset characters."""
+    return len(code) == _CODE_LENGTH and not code.translate(_STRIP_CHARSET)
 
 
 async def generate_invite_code(
@@ -39,6 +54,8 @@ async def generate_invite_code(
 
 async def validate_invite_code(db: AsyncSession, code: str) -> InviteCode | None:
     """Return the InviteCode if valid (exists, not used, not expired). Otherwise None."""
+    if not _is_well_formed(code):
+        return None
     result = await db.execute(select(InviteCode).where(InviteCode.code == code))
     invite = result.scalar_one_or_none()
     if invite is None:
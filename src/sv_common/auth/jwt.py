@@ -1,12 +1,24 @@
 """JWT token creation and validation."""
 
-from datetime import datetime, timedelta, timezone
+import functools
+import time
 
 import jwt
 
 from guild_portal.config import get_settings
 
-_ALGORITHM = "HS256"
+# Claims every access token must carry; enforced by PyJWT in the same
+# decode pass that verifies the signature.
+_REQUIRED_CLAIMS = ["exp", "iat", "user_id", "member_id", "rank_level"]
+
+# One PyJWT instance for the process.
+_jwt = jwt.PyJWT()
+
+
+def _signing_config() -> tuple[bytes, list[str]]:
+    """Return (secret key bytes, [algorithm]) from the current settings."""
+    settings = get_settings()
+    return settings.jwt_secret_key.encode(), [settings.jwt_algorithm]
 
 
 def create_access_token(
@@ -16,23 +28,54 @@ def create_access_token(
     expires_minutes: int | None = None,
 ) -> str:
     """Create a signed JWT containing user_id, member_id, and rank_level."""
-    settings = get_settings()
-    exp_minutes = expires_minutes if expires_minutes is not None else settings.jwt_expire_minutes
+    exp_minutes = (
+        expires_minutes if expires_minutes is not None else get_settings().jwt_expire_minutes
+    )
+    now = int(time.time())
     payload = {
         "user_id": user_id,
         "member_id": member_id,
         "rank_level": rank_level,
-        "exp": datetime.now(timezone.utc) + timedelta(minutes=exp_minutes),
-        "iat": datetime.now(timezone.utc),
+        "exp": now + exp_minutes * 60,
+        "iat": now,
     }
-    return jwt.encode(payload, settings.jwt_secret_key, algorithm=settings.jwt_algorithm)
+    key, algorithms = _signing_config()
+    return _jwt.encode(payload, key, algorithm=algorithms[0])
+
+
+@functools.lru_cache(maxsize=4096)
+def _verified_payload(token: str, key: bytes, algorithm: str) -> dict:
+    """Verify signature, expiry and required claims; cache the payload.
+
+    lru_cache does not store raised exceptions, so invalid or expired tokens
+    are re-checked on every call. Callers must not mutate the result.
+    """
+    return _jwt.decode(
+        token,
+        key,
+        algorithms=[algorithm],
+        options={"require": _REQUIRED_CLAIMS},
+    )
 
 
 def decode_access_token(token: str) -> dict:
     """Decode and validate a JWT. Returns payload dict.
 
     Raises jwt.ExpiredSignatureError if expired.
-    Raises jwt.InvalidTokenError for any other validation failure.
+    Raises jwt.InvalidTokenError for any other validation failure, including
+    a missing required claim.
+
+    Successfully verified tokens are cached, so repeat requests with the same
+    bearer token skip the HMAC check and JSON parse; ``exp`` is still checked
+    on every call. Use ``clear_decode_cache()`` to reset.
     """
-    settings = get_settings()
-    return jwt.decode(token, settings.jwt_secret_key, algorithms=[settings.jwt_algorithm])
+    key, algorithms = _signing_config()
+    payload = _verified_payload(token, key, algorithms[0])
+    if payload["exp"] <= time.time():
+        raise jwt.ExpiredSignatureError("Signature has expired")
+    return dict(payload)
+
+
+def clear_decode_cache() -> None:
+    """Drop every cached verified token."""
+    _verified_payload.cache_clear()
@@ -1,9 +1,20 @@
-"""Password hashing and verification using bcrypt."""
+"""Password hashing and verification using bcrypt.
 
+The ``bcrypt`` package (pyca/bcrypt >= 4) is a Rust extension that releases
+the GIL while hashing, so the ``*_async`` helpers run it on a worker thread
+to keep the event loop serving other requests during a login.
+"""
+
+import asyncio
 import secrets
 
 import bcrypt
 
+from guild_portal.config import get_settings
+
+# bcrypt's minimum cost; the embedded cost in each hash keeps verification correct
+_TEST_BCRYPT_ROUNDS = 4
+
 # Unambiguous characters — no 0/O, 1/I/L
 _TEMP_PW_ALPHABET = "ABCDEFGHJKLMNPQRSTUVWXYZ23456789abcdefghjkmnpqrstuvwxyz"
 
@@ -13,12 +24,29 @@ def generate_temp_password(length: int = 12) -> str:
     return "".join(secrets.choice(_TEMP_PW_ALPHABET) for _ in range(length))
 
 
+def _bcrypt_rounds() -> int:
+    settings = get_settings()
+    if settings.app_env == "testing":
+        return _TEST_BCRYPT_ROUNDS
+    return settings.bcrypt_rounds
+
+
 def hash_password(plain: str) -> str:
     """Hash a plain-text password. Returns bcrypt hash string."""
-    salt = bcrypt.gensalt()
+    salt = bcrypt.gensalt(rounds=_bcrypt_rounds())
     return bcrypt.hashpw(plain.encode(), salt).decode()
 
 
 def verify_password(plain: str, hashed: str) -> bool:
     """Return True if plain matches the stored bcrypt hash."""
     return bcrypt.checkpw(plain.encode(), hashed.encode())
+
+
+async def hash_password_async(plain: str) -> str:
+    """hash_password() on a worker thread, for use from async request handlers."""
+    return await asyncio.to_thread(hash_password, plain)
+
+
+async def verify_password_async(plain: str, hashed: str) -> bool:
+    """verify_password() on a worker thread, for use from async request handlers."""
+    return await asyncio.to_thread(verify_password, plain, hashed)
@@ -22,8 +22,9 @@ import re
 import time
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
+from types import MappingProxyType
 from typing import Optional
-from urllib.parse import quote
+from urllib.parse import quote_from_bytes
 
 import asyncpg
 import httpx
@@ -35,7 +36,7 @@ OAUTH_TOKEN_URL = "https://oauth.battle.net/token"
 API_BASE_URL = "https://us.api.blizzard.com"
 
 
-@dataclass
+@dataclass(slots=True)
 class GuildMemberData:
     """Raw guild member data from the roster endpoint."""
     character_name: str
@@ -55,7 +56,7 @@ class CharacterProfessionData:
     professions: list[dict]  # Raw profession+tier+recipe structure
 
 
-@dataclass
+@dataclass(slots=True)
 class CharacterProfileData:
     """Enriched character data from the profile endpoint."""
     character_name: str
@@ -87,22 +88,22 @@ class CharacterEquipmentSlot:
 
 
 # Blizzard class ID → class name mapping
-CLASS_ID_MAP = {
+CLASS_ID_MAP = MappingProxyType({
     1: "Warrior", 2: "Paladin", 3: "Hunter", 4: "Rogue",
     5: "Priest", 6: "Death Knight", 7: "Shaman", 8: "Mage",
     9: "Warlock", 10: "Monk", 11: "Druid", 12: "Demon Hunter",
     13: "Evoker",
-}
+})
 
 # Guild rank index → rank name mapping (fallback when DB is unavailable)
 # WoW rank 0 is always Guild Master. Lower rank index = more access (WoW standard).
-RANK_NAME_MAP = {
+RANK_NAME_MAP = MappingProxyType({
     0: "Guild Leader",
     1: "Officer",
     2: "Veteran",
     3: "Member",
     4: "Initiate",
-}
+})
 
 
 async def get_rank_name_map(pool: asyncpg.Pool) -> dict[int, str]:
@@ -154,6 +155,15 @@ def should_sync_character(
     return last_login_dt > last_sync
 
 
+def _character_path(realm_slug: str, character_name: str) -> str:
+    """Build the /profile/wow/character path for a character.
+
+    The API requires the name lowercased and percent-encoded (e.g. Zatañña).
+    """
+    name_encoded = quote_from_bytes(character_name.lower().encode("utf-8"), safe="")
+    return f"/profile/wow/character/{realm_slug}/{name_encoded}"
+
+
 class BlizzardClient:
     """Async client for Blizzard's Battle.net API."""
 
@@ -177,6 +187,8 @@ class BlizzardClient:
 
         self._access_token: Optional[str] = None
         self._token_expires_at: float = 0
+        # Serializes refreshes so concurrent callers share one token POST
+        self._refresh_lock = asyncio.Lock()
         self._http_client: Optional[httpx.AsyncClient] = None
         self._request_count = 0
         self._request_window_start = time.time()
@@ -210,9 +222,16 @@ class BlizzardClient:
         logger.info("Blizzard API token refreshed, expires in %d seconds", data.get("expires_in", 0))
 
     async def _ensure_token(self):
-        """Refresh token if expired or about to expire."""
-        if time.time() >= self._token_expires_at:
-            await self._refresh_token()
+        """Refresh token if expired or about to expire.
+
+        Callers that arrive while a refresh is in flight wait on the lock and
+        then see the fresh expiry, so a burst of requests triggers one POST.
+        """
+        if time.time() < self._token_expires_at:
+            return
+        async with self._refresh_lock:
+            if time.time() >= self._token_expires_at:
+                await self._refresh_token()
 
     async def _api_get(
         self, path: str, params: dict = None, _retries: int = 3
@@ -281,7 +300,7 @@ class BlizzardClient:
 
             # Get class name from playable_class id
             class_id = char.get("playable_class", {}).get("id", 0)
-            class_name = CLASS_ID_MAP.get(class_id, f"Unknown({class_id})")
+            class_name = CLASS_ID_MAP.get(class_id) or f"Unknown({class_id})"
 
             # Get realm info
             realm = char.get("realm", {})
@@ -308,12 +327,7 @@ class BlizzardClient:
         Endpoint: /profile/wow/character/{realmSlug}/{characterName}
         Note: Character name must be lowercase for the API.
         """
-        # API requires lowercase character name
-        name_lower = character_name.lower()
-        # Handle special characters in names (e.g., Zatañña)
-        name_encoded = quote(name_lower, safe='')
-
-        path = f"/profile/wow/character/{realm_slug}/{name_encoded}"
+        path = _character_path(realm_slug, character_name)
         data = await self._api_get(path)
 
         if not data:
@@ -354,10 +368,7 @@ class BlizzardClient:
         Endpoint: /profile/wow/character/{realmSlug}/{characterName}/equipment
         Returns: equipped item level or None
         """
-        name_lower = character_name.lower()
-        name_encoded = quote(name_lower, safe='')
-
-        path = f"/profile/wow/character/{realm_slug}/{name_encoded}/equipment"
+        path = _character_path(realm_slug, character_name) + "/equipment"
         data = await self._api_get(path)
 
         if not data:
@@ -379,10 +390,7 @@ class BlizzardClient:
             track_from_display_string, is_crafted_item,
         )
 
-        name_lower = character_name.lower()
-        name_encoded = quote(name_lower, safe='')
-
-        path = f"/profile/wow/character/{realm_slug}/{name_encoded}/equipment"
+        path = _character_path(realm_slug, character_name) + "/equipment"
         data = await self._api_get(path)
 
         if not data or "equipped_items" not in data:
@@ -453,10 +461,7 @@ class BlizzardClient:
         Endpoint: /profile/wow/character/{realmSlug}/{characterName}/professions
         Returns: CharacterProfessionData or None if character not found / no professions
         """
-        name_lower = character_name.lower()
-        name_encoded = quote(name_lower, safe='')
-
-        path = f"/profile/wow/character/{realm_slug}/{name_encoded}/professions"
+        path = _character_path(realm_slug, character_name) + "/professions"
         data = await self._api_get(path)
 
         if not data:
@@ -510,8 +515,7 @@ class BlizzardClient:
         Endpoint: /profile/wow/character/{realm}/{name}/encounters/raids
         Returns the raw API response dict, or None if the character is not found.
         """
-        name_encoded = quote(character_name.lower(), safe="")
-        path = f"/profile/wow/character/{realm_slug}/{name_encoded}/encounters/raids"
+        path = _character_path(realm_slug, character_name) + "/encounters/raids"
         return await self._api_get(path)
 
     async def get_character_mythic_keystone_profile(
@@ -524,8 +528,7 @@ class BlizzardClient:
         Optional season-specific endpoint when season_id is provided.
         Returns None if character not found or has no M+ data.
         """
-        name_encoded = quote(character_name.lower(), safe="")
-        path = f"/profile/wow/character/{realm_slug}/{name_encoded}/mythic-keystone-profile"
+        path = _character_path(realm_slug, character_name) + "/mythic-keystone-profile"
         if season_id:
             path += f"/season/{season_id}"
         return await self._api_get(path)
@@ -540,8 +543,7 @@ class BlizzardClient:
         Endpoint: /profile/wow/character/{realm}/{name}/achievements
         Returns None if character not found.
         """
-        name_encoded = quote(character_name.lower(), safe="")
-        path = f"/profile/wow/character/{realm_slug}/{name_encoded}/achievements"
+        path = _character_path(realm_slug, character_name) + "/achievements"
         return await self._api_get(path)
 
     # ------------------------------------------------------------------
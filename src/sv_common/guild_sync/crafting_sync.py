@@ -86,17 +86,21 @@ def derive_expansion_name(tier_name: str, profession_name: str) -> tuple[str, in
 def compute_sync_cadence(
     config: CraftingSyncConfig,
     season: Optional[SeasonData],
+    *,
+    now: Optional[datetime] = None,
 ) -> tuple[str, int]:
     """
     Determine if we should sync daily or weekly.
 
     Season data comes from guild_portal.raid_seasons (the shared reference table).
+    ``now`` defaults to the current UTC time; pass it to evaluate at a fixed instant.
 
     Returns: (cadence, daily_days_remaining)
         cadence: 'daily' or 'weekly'
         daily_days_remaining: days left in the daily window (0 if weekly)
     """
-    now = datetime.now(timezone.utc)
+    if now is None:
+        now = datetime.now(timezone.utc)
 
     # Admin override takes priority
     if config.cadence_override_until and now < config.cadence_override_until:
@@ -21,6 +21,7 @@ import asyncpg
 import discord
 from discord import app_commands
 
+from sv_common.auth.invite_codes import _CHARSET, _CODE_LENGTH
 from sv_common.config_cache import get_accent_color_int, get_app_url, get_guild_name
 from .provisioner import AutoProvisioner
 from .deadline_checker import OnboardingDeadlineChecker
@@ -313,8 +314,7 @@ def register_onboarding_commands(
             if existing_code:
                 code = existing_code
             else:
-                alphabet = "ABCDEFGHJKLMNPQRSTUVWXYZ23456789"
-                code = "".join(secrets.choice(alphabet) for _ in range(8))
+                code = "".join(secrets.choice(_CHARSET) for _ in range(_CODE_LENGTH))
                 expires_at = datetime.now(timezone.utc) + timedelta(days=7)
                 await conn.execute(
                     """INSERT INTO common.invite_codes
@@ -485,12 +485,13 @@ def register_onboarding_commands(
             )
             return
 
-        from sv_common.auth.passwords import generate_temp_password, hash_password
+        from sv_common.auth.passwords import generate_temp_password, hash_password_async
         temp_pw = generate_temp_password()
+        password_hash = await hash_password_async(temp_pw)
         async with db_pool.acquire() as conn:
             await conn.execute(
                 "UPDATE common.users SET password_hash = $1 WHERE id = $2",
-                hash_password(temp_pw),
+                password_hash,
                 row["id"],
             )
 
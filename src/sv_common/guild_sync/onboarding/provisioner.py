@@ -21,6 +21,8 @@ from typing import Optional
 import asyncpg
 import discord
 
+from sv_common.auth.invite_codes import _CHARSET, _CODE_LENGTH
+
 logger = logging.getLogger(__name__)
 
 # guild rank name → Discord role name (must match actual Discord role names)
@@ -157,8 +159,7 @@ class AutoProvisioner:
     ) -> Optional[str]:
         """Generate a single-use website invite code."""
         try:
-            alphabet = "ABCDEFGHJKLMNPQRSTUVWXYZ23456789"
-            code = "".join(secrets.choice(alphabet) for _ in range(8))
+            code = "".join(secrets.choice(_CHARSET) for _ in range(_CODE_LENGTH))
             expires_at = datetime.now(timezone.utc) + timedelta(days=7)
             async with self.db_pool.acquire() as conn:
                 await conn.execute(
@@ -3,15 +3,19 @@
 Operates on guild_identity.wow_characters and guild_identity.player_characters.
 """
 
-from sqlalchemy import select
+from sqlalchemy import lambda_stmt, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from sv_common.db.models import PlayerCharacter, WowCharacter
 
 
+# Realm display name -> armory slug: drop apostrophes, spaces become hyphens.
+_REALM_SLUG_TABLE = str.maketrans({"'": None, " ": "-"})
+
+
 def build_armory_url(name: str, realm: str) -> str:
     """Build Blizzard armory URL."""
-    clean_realm = realm.lower().replace("'", "").replace(" ", "-")
+    clean_realm = realm.lower().translate(_REALM_SLUG_TABLE)
     return (
         f"https://worldofwarcraft.blizzard.com/en-us/character/us"
         f"/{clean_realm}/{name.lower()}"
@@ -73,19 +77,20 @@ async def unlink_character_from_player(
 async def get_wow_character_by_id(
     db: AsyncSession, character_id: int
 ) -> WowCharacter | None:
-    result = await db.execute(
-        select(WowCharacter).where(WowCharacter.id == character_id)
-    )
+    # lambda_stmt caches the compiled SQL; character_id is bound per call.
+    stmt = lambda_stmt(lambda: select(WowCharacter))
+    stmt += lambda s: s.where(WowCharacter.id == character_id)
+    result = await db.execute(stmt)
     return result.scalar_one_or_none()
 
 
 async def get_wow_character_by_name(
     db: AsyncSession, character_name: str, realm_slug: str
 ) -> WowCharacter | None:
-    result = await db.execute(
-        select(WowCharacter).where(
-            WowCharacter.character_name.ilike(character_name),
-            WowCharacter.realm_slug.ilike(realm_slug),
-        )
+    stmt = lambda_stmt(lambda: select(WowCharacter))
+    stmt += lambda s: s.where(
+        WowCharacter.character_name.ilike(character_name),
+        WowCharacter.realm_slug.ilike(realm_slug),
     )
+    result = await db.execute(stmt)
     return result.scalar_one_or_none()
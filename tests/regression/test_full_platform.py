@@ -6,10 +6,10 @@ Tests the complete lifecycle in one connected flow:
   3. Verify login and /me
   4. Create a campaign with 10 entries
   5. Activate the campaign
-  6. Verify ineligible players cannot vote
+  6. Verify ineligible players cannot vote (service-level check)
   7. Verify non-voters cannot see live results
   8. Each eligible player votes; verify live standings update
-  9. Duplicate vote rejected
+  9. Duplicate vote rejected (service-level check)
  10. Verify vote stats
  11. Early close triggers when all eligible players have voted
  12. Verify final results are correct
@@ -19,14 +19,15 @@ Requires TEST_DATABASE_URL pointing to a running PostgreSQL instance.
 All tests skip gracefully if the database is unavailable.
 """
 
-import secrets
+import itertools
+import os
 from datetime import datetime, timedelta, timezone
 
 import pytest
 from httpx import AsyncClient
-from sqlalchemy import select
+from sqlalchemy import insert, select
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import joinedload
 
 from sv_common.db.models import (
     Campaign,
@@ -37,6 +38,7 @@ from sv_common.db.models import (
     Player,
     User,
 )
+from sv_common.auth.invite_codes import _CHARSET as _INVITE_CHARSET
 from sv_common.auth.jwt import create_access_token
 from sv_common.auth.passwords import hash_password
 from guild_portal.services import campaign_service, vote_service
@@ -47,6 +49,21 @@ from guild_portal.services.contest_agent import detect_milestone
 # Helpers
 # ---------------------------------------------------------------------------
 
+# Invite codes only need to be unique within a run: a random per-process
+# prefix plus a counter, both drawn from the production charset, keeps the
+# 8-char shape validate_invite_code accepts without a CSPRNG call per invite.
+_INV_PREFIX = "".join(_INVITE_CHARSET[b % len(_INVITE_CHARSET)] for b in os.urandom(4))
+_INV_COUNTER = itertools.count()
+
+
+def _next_invite_code() -> str:
+    n = next(_INV_COUNTER)
+    suffix = []
+    for _ in range(4):
+        n, r = divmod(n, len(_INVITE_CHARSET))
+        suffix.append(_INVITE_CHARSET[r])
+    return _INV_PREFIX + "".join(suffix)
+
 
 async def _create_rank(db: AsyncSession, *, name: str, level: int) -> GuildRank:
     r = GuildRank(name=name, level=level, description=f"Rank {name}")
@@ -71,20 +88,37 @@ async def _create_player(
 
 
 async def _create_invite(
-    db: AsyncSession, *, player_id: int, created_by_id: int
+    db: AsyncSession,
+    *,
+    player_id: int,
+    created_by_id: int,
+    expires_at: datetime | None = None,
 ) -> InviteCode:
-    code = secrets.token_hex(8)  # 16-char hex string
+    if expires_at is None:
+        expires_at = datetime.now(timezone.utc) + timedelta(days=7)
+    code = _next_invite_code()
     inv = InviteCode(
         code=code,
         player_id=player_id,
         created_by_player_id=created_by_id,
-        expires_at=datetime.now(timezone.utc) + timedelta(days=7),
+        expires_at=expires_at,
     )
     db.add(inv)
     await db.flush()
     return inv
 
 
+def _picks(first: int, second: int, third: int) -> dict:
+    """Build a ranked-choice vote payload from three entry IDs (rank 1..3)."""
+    return {
+        "picks": [
+            {"entry_id": first, "rank": 1},
+            {"entry_id": second, "rank": 2},
+            {"entry_id": third, "rank": 3},
+        ]
+    }
+
+
 def _auth_headers(player_id: int, rank_level: int) -> dict:
     """Generate Bearer auth headers for a player."""
     token = create_access_token(
@@ -97,7 +131,7 @@ async def _load_with_rank(db: AsyncSession, player_id: int) -> Player:
     """Load a Player with its rank eagerly loaded."""
     result = await db.execute(
         select(Player)
-        .options(selectinload(Player.guild_rank))
+        .options(joinedload(Player.guild_rank))
         .where(Player.id == player_id)
     )
     return result.scalar_one()
@@ -116,6 +150,7 @@ async def test_full_platform_regression(
     This is the "pull a thread anywhere" test. If this passes, the
     platform's core flows work end-to-end.
     """
+    now = datetime.now(timezone.utc)
 
     # ==================================================================
     # 1. SETUP: Ranks and players
@@ -126,36 +161,22 @@ async def test_full_platform_regression(
     rank_officer = await _create_rank(db_session, name="RegOfficer", level=4)
     rank_gl = await _create_rank(db_session, name="RegGuildLeader", level=5)
 
-    # Guild leader (admin, creates campaign)
-    admin = await _create_player(
-        db_session,
-        display_name="Trog",
-        rank_id=rank_gl.id,
-    )
-
-    # Veteran+ players — eligible to vote (min_rank_to_vote=3)
-    vet1 = await _create_player(
-        db_session,
-        display_name="Rocket",
-        rank_id=rank_veteran.id,
-    )
-    vet2 = await _create_player(
-        db_session,
-        display_name="Mito",
-        rank_id=rank_veteran.id,
-    )
-    officer1 = await _create_player(
-        db_session,
-        display_name="Shodoom",
-        rank_id=rank_officer.id,
-    )
-
-    # Initiate — NOT eligible to vote
-    initiate = await _create_player(
-        db_session,
-        display_name="Newbie",
-        rank_id=rank_initiate.id,
+    # One batched INSERT ... RETURNING for all five players, in this order:
+    #   admin    — Guild leader (creates campaign)
+    #   vet1/2   — Veterans, eligible to vote (min_rank_to_vote=3)
+    #   officer1 — Officer, eligible to vote
+    #   initiate — NOT eligible to vote
+    players = await db_session.scalars(
+        insert(Player).returning(Player, sort_by_parameter_order=True),
+        [
+            {"display_name": "Trog", "guild_rank_id": rank_gl.id},
+            {"display_name": "Rocket", "guild_rank_id": rank_veteran.id},
+            {"display_name": "Mito", "guild_rank_id": rank_veteran.id},
+            {"display_name": "Shodoom", "guild_rank_id": rank_officer.id},
+            {"display_name": "Newbie", "guild_rank_id": rank_initiate.id},
+        ],
     )
+    admin, vet1, vet2, officer1, initiate = players.all()
 
     # Admin also gets a website account so they count as eligible in stats
     admin_user = User(
@@ -172,14 +193,18 @@ async def test_full_platform_regression(
     # 2. INVITE CODES: Create for players who will register
     # ==================================================================
 
+    invite_expiry = now + timedelta(days=7)
     inv_vet1 = await _create_invite(
-        db_session, player_id=vet1.id, created_by_id=admin.id
+        db_session, player_id=vet1.id, created_by_id=admin.id,
+        expires_at=invite_expiry,
     )
     inv_vet2 = await _create_invite(
-        db_session, player_id=vet2.id, created_by_id=admin.id
+        db_session, player_id=vet2.id, created_by_id=admin.id,
+        expires_at=invite_expiry,
     )
     inv_off1 = await _create_invite(
-        db_session, player_id=officer1.id, created_by_id=admin.id
+        db_session, player_id=officer1.id, created_by_id=admin.id,
+        expires_at=invite_expiry,
     )
 
     # ==================================================================
@@ -246,7 +271,7 @@ async def test_full_platform_regression(
     assert resp.status_code == 200
     assert resp.json()["ok"] is True
 
-    # Login with wrong password
+    # Login with wrong password (kept at the HTTP layer as an auth smoke check)
     resp = await client.post(
         "/api/v1/auth/login",
         json={"discord_username": "reg_rocket", "password": "wrongpassword"},
@@ -267,7 +292,6 @@ async def test_full_platform_regression(
     # 5. CAMPAIGN: Create, add 10 entries, activate
     # ==================================================================
 
-    now = datetime.now(timezone.utc)
     campaign = await campaign_service.create_campaign(
         db_session,
         title="Salt All The Things Profile Pic Contest",
@@ -301,29 +325,27 @@ async def test_full_platform_regression(
     campaign = await campaign_service.activate_campaign(db_session, campaign.id)
     assert campaign.status == "live"
 
+    vote_url = f"/api/v1/campaigns/{campaign.id}/vote"
+    results_url = f"/api/v1/campaigns/{campaign.id}/results"
+
     # ==================================================================
     # 6. PERMISSION: Ineligible player cannot vote
     # ==================================================================
 
-    resp = await client.post(
-        f"/api/v1/campaigns/{campaign.id}/vote",
-        json={
-            "picks": [
-                {"entry_id": entries[0].id, "rank": 1},
-                {"entry_id": entries[1].id, "rank": 2},
-                {"entry_id": entries[2].id, "rank": 3},
-            ]
-        },
-        headers=_auth_headers(initiate.id, rank_level=1),
-    )
-    assert resp.status_code in (403, 422), "Initiate should be denied voting"
+    with pytest.raises(ValueError, match="minimum required rank"):
+        await vote_service.cast_vote(
+            db_session,
+            campaign_id=campaign.id,
+            player_id=initiate.id,
+            picks=_picks(entries[0].id, entries[1].id, entries[2].id)["picks"],
+        )
 
     # ==================================================================
     # 7. PERMISSION: Non-voter cannot see live results
     # ==================================================================
 
     resp = await client.get(
-        f"/api/v1/campaigns/{campaign.id}/results",
+        results_url,
         headers=_auth_headers(vet1.id, rank_level=3),
     )
     assert resp.status_code == 403, "Non-voter should not see live results"
@@ -334,21 +356,15 @@ async def test_full_platform_regression(
 
     # rocket votes: Trog=1, Rocket=2, Mito=3 → Trog gets 3pts from this
     resp = await client.post(
-        f"/api/v1/campaigns/{campaign.id}/vote",
-        json={
-            "picks": [
-                {"entry_id": entries[0].id, "rank": 1},  # Trog
-                {"entry_id": entries[1].id, "rank": 2},  # Rocket
-                {"entry_id": entries[2].id, "rank": 3},  # Mito
-            ]
-        },
+        vote_url,
+        json=_picks(entries[0].id, entries[1].id, entries[2].id),
         headers=_auth_headers(vet1.id, rank_level=3),
     )
     assert resp.status_code == 200, f"rocket vote failed: {resp.text}"
 
     # Verify rocket can now see live standings
     resp = await client.get(
-        f"/api/v1/campaigns/{campaign.id}/results",
+        results_url,
         headers=_auth_headers(vet1.id, rank_level=3),
     )
     assert resp.status_code == 200
@@ -359,29 +375,18 @@ async def test_full_platform_regression(
     assert standings[0]["weighted_score"] == 3
 
     # Duplicate vote is rejected
-    resp = await client.post(
-        f"/api/v1/campaigns/{campaign.id}/vote",
-        json={
-            "picks": [
-                {"entry_id": entries[0].id, "rank": 1},
-                {"entry_id": entries[1].id, "rank": 2},
-                {"entry_id": entries[2].id, "rank": 3},
-            ]
-        },
-        headers=_auth_headers(vet1.id, rank_level=3),
-    )
-    assert resp.status_code == 400, "Duplicate vote should be rejected"
+    with pytest.raises(ValueError, match="already voted"):
+        await vote_service.cast_vote(
+            db_session,
+            campaign_id=campaign.id,
+            player_id=vet1.id,
+            picks=_picks(entries[0].id, entries[1].id, entries[2].id)["picks"],
+        )
 
     # mito votes: Rocket=1, Trog=2, Mito=3
     resp = await client.post(
-        f"/api/v1/campaigns/{campaign.id}/vote",
-        json={
-            "picks": [
-                {"entry_id": entries[1].id, "rank": 1},  # Rocket
-                {"entry_id": entries[0].id, "rank": 2},  # Trog
-                {"entry_id": entries[2].id, "rank": 3},  # Mito
-            ]
-        },
+        vote_url,
+        json=_picks(entries[1].id, entries[0].id, entries[2].id),
         headers=_auth_headers(vet2.id, rank_level=3),
     )
     assert resp.status_code == 200, f"mito vote failed: {resp.text}"
@@ -389,7 +394,7 @@ async def test_full_platform_regression(
     # Verify standings updated after mito's vote
     # Trog: 3+2=5pts, Rocket: 2+3=5pts (tie), Mito: 1+1=2pts
     resp = await client.get(
-        f"/api/v1/campaigns/{campaign.id}/results",
+        results_url,
         headers=_auth_headers(vet2.id, rank_level=3),
     )
     assert resp.status_code == 200
@@ -399,14 +404,8 @@ async def test_full_platform_regression(
 
     # shodoom votes: Mito=1, Trog=2, Rocket=3
     resp = await client.post(
-        f"/api/v1/campaigns/{campaign.id}/vote",
-        json={
-            "picks": [
-                {"entry_id": entries[2].id, "rank": 1},  # Mito
-                {"entry_id": entries[0].id, "rank": 2},  # Trog
-                {"entry_id": entries[1].id, "rank": 3},  # Rocket
-            ]
-        },
+        vote_url,
+        json=_picks(entries[2].id, entries[0].id, entries[1].id),
         headers=_auth_headers(officer1.id, rank_level=4),
     )
     assert resp.status_code == 200, f"shodoom vote failed: {resp.text}"
@@ -586,6 +585,7 @@ async def test_full_platform_regression(
 
 async def test_invite_code_expiry(db_session: AsyncSession, client: AsyncClient):
     """Expired invite code is rejected at registration."""
+    now = datetime.now(timezone.utc)
     rank = await _create_rank(db_session, name="ExpMember", level=2)
     admin = await _create_player(
         db_session,
@@ -599,12 +599,12 @@ async def test_invite_code_expiry(db_session: AsyncSession, client: AsyncClient)
     )
 
     # Create an already-expired invite code
-    expired_code = secrets.token_hex(8)
+    expired_code = _next_invite_code()
     inv = InviteCode(
         code=expired_code,
         player_id=member.id,
         created_by_player_id=admin.id,
-        expires_at=datetime.now(timezone.utc) - timedelta(days=1),  # Past!
+        expires_at=now - timedelta(days=1),  # Past!
     )
     db_session.add(inv)
     await db_session.flush()
@@ -55,7 +55,7 @@ class TestAdminResetPasswordEndpoint:
     def test_endpoint_calls_hash_password(self):
         """Endpoint hashes the temp password before saving."""
         src = _read_admin_pages()
-        assert "hash_password(temp_pw)" in src
+        assert "await hash_password_async(temp_pw)" in src
 
     def test_endpoint_returns_temp_password_in_response(self):
         """Endpoint returns temp_password in the response data."""
@@ -0,0 +1,29 @@
+"""Unit tests for sv_common.identity.characters.build_armory_url."""
+
+import pytest
+
+from sv_common.identity.characters import build_armory_url
+
+
+# ---------------------------------------------------------------------------
+# build_armory_url (pure function — no DB needed)
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.parametrize(
+    "name, realm, must_contain, must_not_contain",
+    [
+        ("Trogmoon", "Stormrage", ["/stormrage/trogmoon"], ["'", " "]),
+        ("Trogmoon", "Sen'jin", ["senjin"], ["'"]),
+        ("Mychar", "Area 52", ["area-52"], []),
+        ("BIGNAME", "Stormrage", ["/bigname"], []),
+    ],
+    ids=["basic", "apostrophe", "realm-with-spaces", "lowercased-name"],
+)
+def test_build_armory_url(name, realm, must_contain, must_not_contain):
+    url = build_armory_url(name, realm)
+    assert url.startswith("https://worldofwarcraft.blizzard.com/en-us/character/us/")
+    for part in must_contain:
+        assert part in url
+    for part in must_not_contain:
+        assert part not in url
@@ -2,6 +2,7 @@
 
 from datetime import time
 from decimal import Decimal
+from unittest.mock import AsyncMock
 
 import pytest
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -78,6 +79,52 @@ async def test_set_availability_updates_existing(db_session: AsyncSession):
     assert len(rows) == 1
 
 
+async def test_set_availability_bulk_upserts_all_days(db_session: AsyncSession):
+    rank = await _make_rank(db_session, "Member_av6", 2)
+    player = await _make_player(db_session, rank.id, "Player_av6")
+
+    await availability_service.set_player_availability(
+        db_session,
+        player_id=player.id,
+        day_of_week=1,
+        earliest_start=time(18, 0),
+        available_hours=Decimal("2.0"),
+    )
+
+    rows = await availability_service.set_player_availability_bulk(
+        db_session,
+        player.id,
+        [
+            {"day_of_week": 3, "earliest_start": time(21, 0), "available_hours": Decimal("2.5")},
+            {"day_of_week": 1, "earliest_start": time(19, 30), "available_hours": Decimal("3.0")},
+        ],
+    )
+
+    assert [r.day_of_week for r in rows] == [1, 3]
+    assert rows[0].earliest_start == time(19, 30)
+    assert rows[0].available_hours == Decimal("3.0")
+
+    stored = await availability_service.get_player_availability(db_session, player.id)
+    assert len(stored) == 2
+
+
+async def test_set_availability_bulk_validates_before_writing(db_session: AsyncSession):
+    rank = await _make_rank(db_session, "Member_av7", 2)
+    player = await _make_player(db_session, rank.id, "Player_av7")
+
+    with pytest.raises(ValueError, match="available_hours"):
+        await availability_service.set_player_availability_bulk(
+            db_session,
+            player.id,
+            [
+                {"day_of_week": 0, "earliest_start": time(19, 0), "available_hours": Decimal("3.0")},
+                {"day_of_week": 1, "earliest_start": time(19, 0), "available_hours": Decimal("20")},
+            ],
+        )
+
+    assert await availability_service.get_player_availability(db_session, player.id) == []
+
+
 async def test_clear_availability_removes_all_days(db_session: AsyncSession):
     rank = await _make_rank(db_session, "Member_av3", 2)
     player = await _make_player(db_session, rank.id, "Player_av3")
@@ -141,3 +188,37 @@ async def test_availability_day_range_validation(db_session: AsyncSession):
             earliest_start=time(19, 0),
             available_hours=Decimal("3.0"),
         )
+
+
+@pytest.mark.parametrize("day_of_week", [7, -1])
+async def test_invalid_day_rejected_before_any_db_call(day_of_week):
+    db = AsyncMock(spec=AsyncSession)
+
+    with pytest.raises(ValueError, match="day_of_week must be 0"):
+        await availability_service.set_player_availability(
+            db,
+            player_id=1,
+            day_of_week=day_of_week,
+            earliest_start=time(19, 0),
+            available_hours=Decimal("3.0"),
+        )
+
+    db.execute.assert_not_awaited()
+    db.scalars.assert_not_awaited()
+    db.flush.assert_not_awaited()
+
+
+async def test_bulk_duplicate_day_rejected_before_any_db_call():
+    db = AsyncMock(spec=AsyncSession)
+
+    with pytest.raises(ValueError, match="day_of_week 2 given more than once"):
+        await availability_service.set_player_availability_bulk(
+            db,
+            1,
+            [
+                {"day_of_week": 2, "earliest_start": time(19, 0), "available_hours": Decimal("3.0")},
+                {"day_of_week": 2, "earliest_start": time(20, 0), "available_hours": Decimal("2.0")},
+            ],
+        )
+
+    db.scalars.assert_not_awaited()
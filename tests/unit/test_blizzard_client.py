@@ -6,6 +6,9 @@ Tests cover: token refresh, roster parsing, character profile parsing,
 special character URL encoding, 404 handling, and static data maps.
 """
 
+import asyncio
+from types import SimpleNamespace
+
 import pytest
 import pytest_asyncio
 from unittest.mock import AsyncMock, MagicMock
@@ -37,12 +40,14 @@ async def client():
 
 
 def _make_response(status_code: int = 200, json_data: dict = None):
-    """Build a mock httpx response."""
-    mock = MagicMock()
-    mock.status_code = status_code
-    mock.json.return_value = json_data or {}
-    mock.raise_for_status = MagicMock()
-    return mock
+    """Build a stub httpx response exposing only what BlizzardClient reads."""
+    data = json_data or {}
+    return SimpleNamespace(
+        status_code=status_code,
+        headers={},
+        json=lambda: data,
+        raise_for_status=lambda: None,
+    )
 
 
 class TestTokenRefresh:
@@ -62,6 +67,25 @@ class TestTokenRefresh:
         assert client._access_token == "fresh_token"
         client._http_client.post.assert_called_once()
 
+    async def test_concurrent_expiry_refreshes_once(self, client):
+        """Concurrent callers on an expired token share a single refresh POST."""
+        token_response = _make_response(200, {
+            "access_token": "fresh_token",
+            "expires_in": 86400,
+        })
+
+        async def _slow_post(*args, **kwargs):
+            await asyncio.sleep(0)
+            return token_response
+
+        client._http_client.post = AsyncMock(side_effect=_slow_post)
+        client._token_expires_at = 0
+
+        await asyncio.gather(*(client._ensure_token() for _ in range(5)))
+
+        assert client._access_token == "fresh_token"
+        client._http_client.post.assert_called_once()
+
     async def test_valid_token_skips_refresh(self, client):
         """Valid token — _ensure_token should NOT call _refresh_token."""
         client._http_client.post = AsyncMock()
@@ -133,36 +157,39 @@ class TestGetGuildRoster:
         roster = await client.get_guild_roster()
         assert roster[0].blizzard_character_id is None
 
-    async def test_empty_roster_returns_empty_list(self, client):
-        response = _make_response(200, {"members": []})
-        client._http_client.get = AsyncMock(return_value=response)
-
-        roster = await client.get_guild_roster()
-        assert roster == []
-
-    async def test_missing_members_key_returns_empty_list(self, client):
-        response = _make_response(200, {})
-        client._http_client.get = AsyncMock(return_value=response)
+    @pytest.mark.parametrize(
+        "payload",
+        [{"members": []}, {}],
+        ids=["empty-members", "missing-members-key"],
+    )
+    async def test_empty_roster_returns_empty_list(self, client, payload):
+        client._http_client.get = AsyncMock(return_value=_make_response(200, payload))
 
         roster = await client.get_guild_roster()
         assert roster == []
 
-    async def test_unknown_class_id_uses_fallback(self, client):
-        response = _make_response(200, {
-            "members": [{
-                "character": {
-                    "name": "Zap",
-                    "realm": {"slug": "senjin", "name": "Sen'jin"},
-                    "level": 80,
-                    "playable_class": {"id": 999},  # Unknown
-                },
-                "rank": 3,
-            }]
-        })
+    @pytest.mark.parametrize(
+        "playable_class, expected",
+        [
+            ({"id": 999}, "Unknown(999)"),
+            ({"id": None}, "Unknown(None)"),
+            (None, "Unknown(0)"),
+        ],
+        ids=["unknown-id", "null-id", "missing-class"],
+    )
+    async def test_unknown_class_id_uses_fallback(self, client, playable_class, expected):
+        character = {
+            "name": "Zap",
+            "realm": {"slug": "senjin", "name": "Sen'jin"},
+            "level": 80,
+        }
+        if playable_class is not None:
+            character["playable_class"] = playable_class
+        response = _make_response(200, {"members": [{"character": character, "rank": 3}]})
         client._http_client.get = AsyncMock(return_value=response)
 
         roster = await client.get_guild_roster()
-        assert "Unknown" in roster[0].character_class
+        assert roster[0].character_class == expected
 
 
 class TestGetCharacterProfile:
@@ -280,5 +307,17 @@ class TestStaticMaps:
     def test_druid_class_id(self):
         assert CLASS_ID_MAP[11] == "Druid"
 
+    def test_parsed_records_use_slots(self):
+        member = GuildMemberData("Trogmoon", "senjin", "Sen'jin", "Druid", 80, 3)
+        profile = CharacterProfileData("Trogmoon", "senjin", "Sen'jin", "Druid")
+        assert not hasattr(member, "__dict__")
+        assert not hasattr(profile, "__dict__")
+
     def test_evoker_class_id(self):
         assert CLASS_ID_MAP[13] == "Evoker"
+
+    def test_static_maps_are_read_only(self):
+        with pytest.raises(TypeError):
+            CLASS_ID_MAP[14] = "Tinker"
+        with pytest.raises(TypeError):
+            RANK_NAME_MAP[0] = "Officer"
@@ -5,15 +5,17 @@ All HTTP calls are mocked — no real network access.
 Tests cover: profession parsing, gathering prof filtering, None returns.
 """
 
-import pytest
 import time
+from types import SimpleNamespace
 from unittest.mock import AsyncMock, MagicMock
 
+import pytest
+import pytest_asyncio
+
 from sv_common.guild_sync.blizzard_client import BlizzardClient, CharacterProfessionData
 
 
-@pytest.fixture
-def client():
+def _make_client():
     c = BlizzardClient(
         client_id="test_id",
         client_secret="test_secret",
@@ -24,12 +26,19 @@ def client():
     return c
 
 
+@pytest.fixture
+def client():
+    return _make_client()
+
+
 def _make_response(status_code=200, json_data=None):
-    mock = MagicMock()
-    mock.status_code = status_code
-    mock.json.return_value = json_data or {}
-    mock.raise_for_status = MagicMock()
-    return mock
+    data = json_data or {}
+    return SimpleNamespace(
+        status_code=status_code,
+        headers={},
+        json=lambda: data,
+        raise_for_status=lambda: None,
+    )
 
 
 _SAMPLE_PROFESSION_RESPONSE = {
@@ -86,60 +95,54 @@ _SAMPLE_PROFESSION_RESPONSE = {
 }
 
 
-class TestGetCharacterProfessions:
-    async def test_parses_primary_professions(self, client):
-        client._http_client.get = AsyncMock(
-            return_value=_make_response(200, _SAMPLE_PROFESSION_RESPONSE)
-        )
-        result = await client.get_character_professions("senjin", "Trogmoon")
+# Stateless stub — safe to hand to every test that fetches the sample
+_SAMPLE_RESPONSE_OBJ = _make_response(200, _SAMPLE_PROFESSION_RESPONSE)
+
+
+@pytest_asyncio.fixture(scope="session")
+async def professions_result():
+    """Parsed _SAMPLE_PROFESSION_RESPONSE for Trogmoon, computed once per session.
+
+    Tests using this must only read from it.
+    """
+    c = _make_client()
+    c._http_client.get = AsyncMock(return_value=_SAMPLE_RESPONSE_OBJ)
+    return await c.get_character_professions("senjin", "Trogmoon")
+
 
-        assert result is not None
-        assert isinstance(result, CharacterProfessionData)
-        assert result.character_name == "Trogmoon"
-        assert result.realm_slug == "senjin"
+@pytest.fixture(scope="session")
+def prof_index(professions_result):
+    """professions_result.professions keyed by profession name."""
+    return {p["profession_name"]: p for p in professions_result.professions}
+
+
+class TestGetCharacterProfessions:
+    async def test_parses_primary_professions(self, professions_result):
+        assert professions_result is not None
+        assert isinstance(professions_result, CharacterProfessionData)
+        assert professions_result.character_name == "Trogmoon"
+        assert professions_result.realm_slug == "senjin"
 
         # Blacksmithing should be present (2 tiers with recipes)
-        prof_names = [p["profession_name"] for p in result.professions]
+        prof_names = [p["profession_name"] for p in professions_result.professions]
         assert "Blacksmithing" in prof_names
 
-    def test_gathering_profession_excluded(self, client):
+    async def test_gathering_profession_excluded(self, professions_result):
         """Mining has no known_recipes — should be excluded from result."""
-        import asyncio
-
-        async def _run():
-            client._http_client.get = AsyncMock(
-                return_value=_make_response(200, _SAMPLE_PROFESSION_RESPONSE)
-            )
-            result = await client.get_character_professions("senjin", "Trogmoon")
-            prof_names = [p["profession_name"] for p in result.professions]
-            assert "Mining" not in prof_names
-
-        asyncio.get_event_loop().run_until_complete(_run())
-
-    async def test_secondaries_included_if_recipes(self, client):
-        client._http_client.get = AsyncMock(
-            return_value=_make_response(200, _SAMPLE_PROFESSION_RESPONSE)
-        )
-        result = await client.get_character_professions("senjin", "Trogmoon")
-        prof_names = [p["profession_name"] for p in result.professions]
-        assert "Cooking" in prof_names
+        prof_names = [p["profession_name"] for p in professions_result.professions]
+        assert "Mining" not in prof_names
 
-    async def test_recipe_count(self, client):
-        client._http_client.get = AsyncMock(
-            return_value=_make_response(200, _SAMPLE_PROFESSION_RESPONSE)
-        )
-        result = await client.get_character_professions("senjin", "Trogmoon")
+    async def test_secondaries_included_if_recipes(self, professions_result):
+        prof_names = [p["profession_name"] for p in professions_result.professions]
+        assert "Cooking" in prof_names
 
-        bs = next(p for p in result.professions if p["profession_name"] == "Blacksmithing")
+    def test_recipe_count(self, prof_index):
+        bs = prof_index["Blacksmithing"]
         all_recipes = [r for t in bs["tiers"] for r in t["known_recipes"]]
         assert len(all_recipes) == 3  # 2 KA + 1 DI
 
-    async def test_recipe_has_id_and_name(self, client):
-        client._http_client.get = AsyncMock(
-            return_value=_make_response(200, _SAMPLE_PROFESSION_RESPONSE)
-        )
-        result = await client.get_character_professions("senjin", "Trogmoon")
-        bs = next(p for p in result.professions if p["profession_name"] == "Blacksmithing")
+    def test_recipe_has_id_and_name(self, prof_index):
+        bs = prof_index["Blacksmithing"]
         tier = bs["tiers"][0]
         recipe = tier["known_recipes"][0]
         assert "id" in recipe
@@ -147,13 +150,9 @@ class TestGetCharacterProfessions:
         assert recipe["id"] == 453287
         assert recipe["name"] == "Everforged Breastplate"
 
-    async def test_is_primary_flag(self, client):
-        client._http_client.get = AsyncMock(
-            return_value=_make_response(200, _SAMPLE_PROFESSION_RESPONSE)
-        )
-        result = await client.get_character_professions("senjin", "Trogmoon")
-        bs = next(p for p in result.professions if p["profession_name"] == "Blacksmithing")
-        cooking = next(p for p in result.professions if p["profession_name"] == "Cooking")
+    def test_is_primary_flag(self, prof_index):
+        bs = prof_index["Blacksmithing"]
+        cooking = prof_index["Cooking"]
         assert bs["is_primary"] is True
         assert cooking["is_primary"] is False
 
@@ -183,21 +182,15 @@ class TestGetCharacterProfessions:
         assert result is None
 
     async def test_name_lowercased_in_url(self, client):
-        client._http_client.get = AsyncMock(
-            return_value=_make_response(200, _SAMPLE_PROFESSION_RESPONSE)
-        )
+        client._http_client.get = AsyncMock(return_value=_SAMPLE_RESPONSE_OBJ)
         await client.get_character_professions("senjin", "TROGMOON")
         call_args = client._http_client.get.call_args
         url = call_args[0][0]
         assert "trogmoon" in url
         assert "TROGMOON" not in url
 
-    async def test_tier_skill_data_preserved(self, client):
-        client._http_client.get = AsyncMock(
-            return_value=_make_response(200, _SAMPLE_PROFESSION_RESPONSE)
-        )
-        result = await client.get_character_professions("senjin", "Trogmoon")
-        bs = next(p for p in result.professions if p["profession_name"] == "Blacksmithing")
+    def test_tier_skill_data_preserved(self, prof_index):
+        bs = prof_index["Blacksmithing"]
         tier = bs["tiers"][0]
         assert tier["skill_points"] == 100
         assert tier["max_skill_points"] == 100
@@ -7,52 +7,104 @@ All tests use mock asyncpg pools — no real database required.
 import pytest
 from unittest.mock import AsyncMock, MagicMock, patch
 
+from sv_common.db.models import DiscordConfig
+from sv_common.discord import dm as dm_module
+from sv_common.discord.dm import is_bot_dm_enabled
+from sv_common.guild_sync.onboarding.conversation import OnboardingConversation
+from sv_common.guild_sync.onboarding.deadline_checker import OnboardingDeadlineChecker
+from sv_common.guild_sync.onboarding.provisioner import AutoProvisioner
+
 
 # ---------------------------------------------------------------------------
 # is_bot_dm_enabled()
 # ---------------------------------------------------------------------------
 
 
-def _make_pool(fetchval_return):
-    """Build a minimal mock asyncpg pool that returns a fixed value from fetchval."""
-    conn = AsyncMock()
-    conn.fetchval = AsyncMock(return_value=fetchval_return)
+class _Acquire:
+    """Async context manager returned by _Pool.acquire()."""
+
+    def __init__(self, conn):
+        self._conn = conn
+
+    async def __aenter__(self):
+        return self._conn
+
+    async def __aexit__(self, *exc):
+        return False
+
+
+class _Pool:
+    """Minimal stand-in for asyncpg.Pool: acquire() hands out one shared conn."""
+
+    def __init__(self, conn):
+        self._conn = conn
+
+    def acquire(self):
+        return _Acquire(self._conn)
 
-    pool = MagicMock()
-    pool.acquire = MagicMock()
-    pool.acquire.return_value.__aenter__ = AsyncMock(return_value=conn)
-    pool.acquire.return_value.__aexit__ = AsyncMock(return_value=False)
-    return pool, conn
 
+def _make_member(member_id: int, name: str) -> MagicMock:
+    """discord.Member stand-in limited to the attributes start() reads."""
+    member = MagicMock(spec_set=["id", "name", "nick", "display_name", "joined_at"])
+    # ``name`` is a reserved MagicMock kwarg, so configure after construction
+    member.configure_mock(
+        id=member_id, name=name, nick=None, display_name=name, joined_at=None
+    )
+    return member
 
-@pytest.mark.asyncio
-async def test_is_bot_dm_enabled_returns_false_when_flag_is_false():
-    """is_bot_dm_enabled returns False when the DB flag is false."""
-    from sv_common.discord.dm import is_bot_dm_enabled
 
-    pool, _ = _make_pool(False)
-    result = await is_bot_dm_enabled(pool)
-    assert result is False
+@pytest.fixture
+def pool_factory():
+    """Factory for minimal mock asyncpg pools.
+
+    ``pool_factory(fetchval=..., fetchrow=..., fetch=...)`` returns
+    ``(pool, conn)``, where ``pool.acquire()`` yields ``conn`` and each conn
+    method returns the given value. Pass ``fetchval_seq`` instead of
+    ``fetchval`` when successive calls must return different values.
+    """
+    def _make(fetchval=None, fetchrow=None, fetch=(), fetchval_seq=None):
+        conn = AsyncMock(spec_set=["fetchval", "fetchrow", "fetch", "execute"])
+        if fetchval_seq is not None:
+            conn.fetchval = AsyncMock(side_effect=list(fetchval_seq))
+        else:
+            conn.fetchval = AsyncMock(return_value=fetchval)
+        conn.fetchrow = AsyncMock(return_value=fetchrow)
+        conn.fetch = AsyncMock(return_value=list(fetch))
+        conn.execute = AsyncMock()
+        return _Pool(conn), conn
+
+    return _make
 
 
-@pytest.mark.asyncio
-async def test_is_bot_dm_enabled_returns_true_when_flag_is_true():
-    """is_bot_dm_enabled returns True when the DB flag is true."""
-    from sv_common.discord.dm import is_bot_dm_enabled
+# Shared gate stubs; dm_gate resets their call records after each test
+_GATE_STUBS = {True: AsyncMock(return_value=True), False: AsyncMock(return_value=False)}
 
-    pool, _ = _make_pool(True)
-    result = await is_bot_dm_enabled(pool)
-    assert result is True
 
+@pytest.fixture
+def dm_gate(monkeypatch):
+    """Force every sv_common.discord.dm gate to a fixed answer.
+
+    Callers import the gates lazily from the module, so patching the module
+    attributes covers is_bot_dm_enabled and the per-feature gates alike.
+    """
+    def _set(enabled: bool):
+        for name in ("is_bot_dm_enabled", "is_onboarding_dm_enabled", "is_invite_dm_enabled"):
+            monkeypatch.setattr(dm_module, name, _GATE_STUBS[enabled])
 
-@pytest.mark.asyncio
-async def test_is_bot_dm_enabled_returns_false_when_no_config_row():
-    """is_bot_dm_enabled returns False when discord_config has no rows (None returned)."""
-    from sv_common.discord.dm import is_bot_dm_enabled
+    yield _set
+    for stub in _GATE_STUBS.values():
+        stub.reset_mock()
 
-    pool, _ = _make_pool(None)
-    result = await is_bot_dm_enabled(pool)
-    assert result is False
+
+@pytest.mark.parametrize(
+    "flag, expected",
+    [(False, False), (True, True), (None, False)],
+    ids=["flag-false", "flag-true", "no-config-row"],
+)
+async def test_is_bot_dm_enabled(pool_factory, flag, expected):
+    """is_bot_dm_enabled mirrors the DB flag; a missing config row (None) means False."""
+    pool, _ = pool_factory(fetchval=flag)
+    assert await is_bot_dm_enabled(pool) is expected
 
 
 # ---------------------------------------------------------------------------
@@ -60,38 +112,22 @@ async def test_is_bot_dm_enabled_returns_false_when_no_config_row():
 # ---------------------------------------------------------------------------
 
 
-@pytest.mark.asyncio
-async def test_conversation_start_creates_session_but_skips_dm_when_disabled():
+async def test_conversation_start_creates_session_but_skips_dm_when_disabled(pool_factory, dm_gate):
     """
     When bot_dm_enabled=False, start() should create an onboarding session
     in awaiting_dm state but NOT call _send_welcome().
     """
-    from sv_common.guild_sync.onboarding.conversation import OnboardingConversation
-
-    # Mock discord member
-    member = MagicMock()
-    member.id = 123456789
-    member.name = "Trogmoon"
-    member.nick = None
-    member.display_name = "Trogmoon"
-    member.joined_at = None
+    member = _make_member(123456789, "Trogmoon")
 
     # Build pool: no existing session, discord_users lookup returns dm_id=1,
     # onboarding_sessions insert returns session_id=42
-    conn = AsyncMock()
-    conn.fetchrow = AsyncMock(return_value=None)  # no existing session
-    conn.fetchval = AsyncMock(side_effect=[1, 42])  # discord_users.id=1, session_id=42
-
-    pool = MagicMock()
-    pool.acquire = MagicMock()
-    pool.acquire.return_value.__aenter__ = AsyncMock(return_value=conn)
-    pool.acquire.return_value.__aexit__ = AsyncMock(return_value=False)
+    pool, _ = pool_factory(fetchval_seq=[1, 42])
 
     bot = MagicMock()
     conv = OnboardingConversation(bot, member, pool)
 
-    with patch("sv_common.discord.dm.is_bot_dm_enabled", new=AsyncMock(return_value=False)):
-        await conv.start()
+    dm_gate(False)
+    await conv.start()
 
     # Session was created
     assert conv.session_id == 42
@@ -99,66 +135,40 @@ async def test_conversation_start_creates_session_but_skips_dm_when_disabled():
     bot.wait_for.assert_not_called()
 
 
-@pytest.mark.asyncio
-async def test_conversation_start_calls_send_welcome_when_dm_enabled():
+async def test_conversation_start_calls_send_welcome_when_dm_enabled(pool_factory, dm_gate):
     """
     When bot_dm_enabled=True, start() should call _send_welcome().
     _send_welcome is patched so we just verify it was called.
     """
-    from sv_common.guild_sync.onboarding.conversation import OnboardingConversation
-
-    member = MagicMock()
-    member.id = 987654321
-    member.name = "Rocketman"
-    member.nick = None
-    member.display_name = "Rocketman"
-    member.joined_at = None
+    member = _make_member(987654321, "Rocketman")
 
-    conn = AsyncMock()
-    conn.fetchrow = AsyncMock(return_value=None)  # no existing session
-    conn.fetchval = AsyncMock(side_effect=[2, 99])
-
-    pool = MagicMock()
-    pool.acquire = MagicMock()
-    pool.acquire.return_value.__aenter__ = AsyncMock(return_value=conn)
-    pool.acquire.return_value.__aexit__ = AsyncMock(return_value=False)
+    pool, _ = pool_factory(fetchval_seq=[2, 99])  # no existing session
 
     bot = MagicMock()
     conv = OnboardingConversation(bot, member, pool)
 
-    with patch("sv_common.discord.dm.is_onboarding_dm_enabled", new=AsyncMock(return_value=True)):
-        with patch.object(conv, "_send_welcome", new=AsyncMock()) as mock_welcome:
-            await conv.start()
+    dm_gate(True)
+    with patch.object(conv, "_send_welcome", new=AsyncMock()) as mock_welcome:
+        await conv.start()
 
     mock_welcome.assert_called_once()
 
 
-@pytest.mark.asyncio
-async def test_conversation_start_skips_if_existing_active_session():
+async def test_conversation_start_skips_if_existing_active_session(pool_factory, dm_gate):
     """
     start() should bail early and NOT create a new session if an active one exists.
     """
-    from sv_common.guild_sync.onboarding.conversation import OnboardingConversation
-
-    member = MagicMock()
-    member.id = 111
-    member.name = "Existing"
+    member = _make_member(111, "Existing")
 
     existing = {"id": 7, "state": "pending_verification"}
-    conn = AsyncMock()
-    conn.fetchrow = AsyncMock(return_value=existing)
-
-    pool = MagicMock()
-    pool.acquire = MagicMock()
-    pool.acquire.return_value.__aenter__ = AsyncMock(return_value=conn)
-    pool.acquire.return_value.__aexit__ = AsyncMock(return_value=False)
+    pool, conn = pool_factory(fetchrow=existing)
 
     bot = MagicMock()
     conv = OnboardingConversation(bot, member, pool)
 
     # Even with DM enabled, existing session should bail early
-    with patch("sv_common.discord.dm.is_bot_dm_enabled", new=AsyncMock(return_value=True)):
-        await conv.start()
+    dm_gate(True)
+    await conv.start()
 
     assert conv.session_id == 7
     # No insert should have happened (fetchval not called after fetchrow returned existing)
@@ -170,31 +180,25 @@ async def test_conversation_start_skips_if_existing_active_session():
 # ---------------------------------------------------------------------------
 
 
-@pytest.mark.asyncio
-async def test_provisioner_skips_invite_dm_when_dm_disabled():
+async def test_provisioner_skips_invite_dm_when_dm_disabled(dm_gate):
     """
     _send_invite_dm should log and return without sending when DM is disabled.
     """
-    from sv_common.guild_sync.onboarding.provisioner import AutoProvisioner
-
     pool = MagicMock()
     bot = AsyncMock()
     provisioner = AutoProvisioner(pool, bot)
 
-    with patch("sv_common.discord.dm.is_bot_dm_enabled", new=AsyncMock(return_value=False)):
-        await provisioner._send_invite_dm("123456", "TESTCODE")
+    dm_gate(False)
+    await provisioner._send_invite_dm("123456", "TESTCODE")
 
     # Bot should NOT have been asked to fetch a user
     bot.fetch_user.assert_not_called()
 
 
-@pytest.mark.asyncio
-async def test_provisioner_sends_invite_dm_when_dm_enabled():
+async def test_provisioner_sends_invite_dm_when_dm_enabled(dm_gate):
     """
     _send_invite_dm sends the DM when bot_dm_enabled is True.
     """
-    from sv_common.guild_sync.onboarding.provisioner import AutoProvisioner
-
     pool = MagicMock()
     bot = AsyncMock()
     user = AsyncMock()
@@ -204,8 +208,8 @@ async def test_provisioner_sends_invite_dm_when_dm_enabled():
 
     provisioner = AutoProvisioner(pool, bot)
 
-    with patch("sv_common.discord.dm.is_bot_dm_enabled", new=AsyncMock(return_value=True)):
-        await provisioner._send_invite_dm("123456", "TESTCODE")
+    dm_gate(True)
+    await provisioner._send_invite_dm("123456", "TESTCODE")
 
     bot.fetch_user.assert_called_once_with(123456)
     dm_channel.send.assert_called_once()
@@ -216,41 +220,29 @@ async def test_provisioner_sends_invite_dm_when_dm_enabled():
 # ---------------------------------------------------------------------------
 
 
-@pytest.mark.asyncio
-async def test_resume_awaiting_dm_skips_when_dm_disabled():
+async def test_resume_awaiting_dm_skips_when_dm_disabled(dm_gate):
     """
     _resume_awaiting_dm_sessions returns 0 immediately when DMs are disabled.
     """
-    from sv_common.guild_sync.onboarding.deadline_checker import OnboardingDeadlineChecker
-
     pool = MagicMock()
     checker = OnboardingDeadlineChecker(pool)
 
-    with patch("sv_common.discord.dm.is_bot_dm_enabled", new=AsyncMock(return_value=False)):
-        result = await checker._resume_awaiting_dm_sessions()
+    dm_gate(False)
+    result = await checker._resume_awaiting_dm_sessions()
 
     assert result == 0
 
 
-@pytest.mark.asyncio
-async def test_resume_awaiting_dm_skips_when_no_sessions():
+async def test_resume_awaiting_dm_skips_when_no_sessions(pool_factory, dm_gate):
     """
     _resume_awaiting_dm_sessions returns 0 when DMs are enabled but no awaiting sessions.
     """
-    from sv_common.guild_sync.onboarding.deadline_checker import OnboardingDeadlineChecker
-
-    conn = AsyncMock()
-    conn.fetch = AsyncMock(return_value=[])
-
-    pool = MagicMock()
-    pool.acquire = MagicMock()
-    pool.acquire.return_value.__aenter__ = AsyncMock(return_value=conn)
-    pool.acquire.return_value.__aexit__ = AsyncMock(return_value=False)
+    pool, _ = pool_factory(fetch=[])
 
     checker = OnboardingDeadlineChecker(pool, bot=None)
 
-    with patch("sv_common.discord.dm.is_bot_dm_enabled", new=AsyncMock(return_value=True)):
-        result = await checker._resume_awaiting_dm_sessions()
+    dm_gate(True)
+    result = await checker._resume_awaiting_dm_sessions()
 
     assert result == 0
 
@@ -260,9 +252,11 @@ async def test_resume_awaiting_dm_skips_when_no_sessions():
 # ---------------------------------------------------------------------------
 
 
-def test_discord_config_has_bot_dm_enabled():
-    """DiscordConfig model has the bot_dm_enabled column."""
-    from sv_common.db.models import DiscordConfig
+@pytest.fixture(scope="module")
+def discord_config_columns():
+    return {c.name for c in DiscordConfig.__table__.columns}
 
-    columns = {c.name for c in DiscordConfig.__table__.columns}
-    assert "bot_dm_enabled" in columns
+
+def test_discord_config_has_bot_dm_enabled(discord_config_columns):
+    """DiscordConfig model has the bot_dm_enabled column."""
+    assert "bot_dm_enabled" in discord_config_columns
@@ -1,37 +1,12 @@
 """Unit tests for sv_common.identity.characters service functions."""
 
 import pytest
+import pytest_asyncio
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from sv_common.db.models import GuildRank, Player, WowCharacter
 from sv_common.identity import characters as char_service
-from sv_common.identity.characters import build_armory_url
-
-
-# ---------------------------------------------------------------------------
-# build_armory_url (pure function — no DB needed)
-# ---------------------------------------------------------------------------
-
-
-def test_build_armory_url_basic():
-    url = build_armory_url("Trogmoon", "Stormrage")
-    assert url == "https://worldofwarcraft.blizzard.com/en-us/character/us/stormrage/trogmoon"
-
-
-def test_build_armory_url_senjin_apostrophe_handling():
-    url = build_armory_url("Trogmoon", "Sen'jin")
-    assert "senjin" in url
-    assert "'" not in url
-
-
-def test_build_armory_url_realm_with_spaces():
-    url = build_armory_url("Mychar", "Area 52")
-    assert "area-52" in url
-
-
-def test_build_armory_url_lowercase_name():
-    url = build_armory_url("BIGNAME", "Stormrage")
-    assert "/bigname" in url
 
 
 # ---------------------------------------------------------------------------
@@ -39,36 +14,43 @@ def test_build_armory_url_lowercase_name():
 # ---------------------------------------------------------------------------
 
 
-async def _make_rank(db: AsyncSession, name: str, level: int) -> GuildRank:
+async def _make_rank(db: AsyncSession, name: str = "Member", level: int = 2) -> GuildRank:
     rank = GuildRank(name=name, level=level)
     db.add(rank)
     await db.flush()
     return rank
 
 
-async def _make_player(db: AsyncSession, rank_id: int, name: str) -> Player:
+async def _make_player(db: AsyncSession, rank_id: int, name: str = "Player") -> Player:
     player = Player(display_name=name, guild_rank_id=rank_id)
     db.add(player)
     await db.flush()
     return player
 
 
-async def _make_wow_char(db: AsyncSession, char_name: str, realm: str = "senjin") -> WowCharacter:
+async def _make_wow_char(
+    db: AsyncSession, char_name: str = "Char", realm: str = "senjin"
+) -> WowCharacter:
     char = WowCharacter(character_name=char_name, realm_slug=realm)
     db.add(char)
     await db.flush()
     return char
 
 
+@pytest_asyncio.fixture
+async def player(db_session: AsyncSession) -> Player:
+    """A ranked player; rolled back with the rest of the test's SAVEPOINT."""
+    rank = await _make_rank(db_session)
+    return await _make_player(db_session, rank.id)
+
+
 # ---------------------------------------------------------------------------
 # link / unlink / get operations
 # ---------------------------------------------------------------------------
 
 
-async def test_link_character_to_player(db_session: AsyncSession):
-    rank = await _make_rank(db_session, "Member_lcp", 2)
-    player = await _make_player(db_session, rank.id, "LinkPlayer")
-    char = await _make_wow_char(db_session, "LinkChar_lcp")
+async def test_link_character_to_player(db_session: AsyncSession, player: Player):
+    char = await _make_wow_char(db_session)
 
     bridge = await char_service.link_character_to_player(db_session, player.id, char.id)
 
@@ -76,33 +58,28 @@ async def test_link_character_to_player(db_session: AsyncSession):
     assert bridge.character_id == char.id
 
 
-async def test_get_characters_for_player(db_session: AsyncSession):
-    rank = await _make_rank(db_session, "Member_gcfp", 2)
-    player = await _make_player(db_session, rank.id, "MultiPlayer_gcfp")
-    char1 = await _make_wow_char(db_session, "CharA_gcfp")
-    char2 = await _make_wow_char(db_session, "CharB_gcfp")
+async def test_get_characters_for_player(db_session: AsyncSession, player: Player):
+    char1 = WowCharacter(character_name="CharA", realm_slug="senjin")
+    char2 = WowCharacter(character_name="CharB", realm_slug="senjin")
+    db_session.add_all([char1, char2])
+    await db_session.flush()
 
     await char_service.link_character_to_player(db_session, player.id, char1.id)
     await char_service.link_character_to_player(db_session, player.id, char2.id)
 
     chars = await char_service.get_characters_for_player(db_session, player.id)
     names = [c.character_name for c in chars]
-    assert "CharA_gcfp" in names
-    assert "CharB_gcfp" in names
-
+    assert "CharA" in names
+    assert "CharB" in names
 
-async def test_get_characters_for_player_empty(db_session: AsyncSession):
-    rank = await _make_rank(db_session, "Member_gcfpe", 2)
-    player = await _make_player(db_session, rank.id, "EmptyPlayer_gcfpe")
 
+async def test_get_characters_for_player_empty(db_session: AsyncSession, player: Player):
     chars = await char_service.get_characters_for_player(db_session, player.id)
     assert chars == []
 
 
-async def test_get_player_for_character(db_session: AsyncSession):
-    rank = await _make_rank(db_session, "Member_gpfc", 2)
-    player = await _make_player(db_session, rank.id, "OwnerPlayer_gpfc")
-    char = await _make_wow_char(db_session, "OwnedChar_gpfc")
+async def test_get_player_for_character(db_session: AsyncSession, player: Player):
+    char = await _make_wow_char(db_session)
 
     await char_service.link_character_to_player(db_session, player.id, char.id)
 
@@ -111,16 +88,14 @@ async def test_get_player_for_character(db_session: AsyncSession):
 
 
 async def test_get_player_for_character_not_linked(db_session: AsyncSession):
-    char = await _make_wow_char(db_session, "UnlinkedChar_gpfc")
+    char = await _make_wow_char(db_session)
 
     found = await char_service.get_player_for_character(db_session, char.id)
     assert found is None
 
 
-async def test_unlink_character_from_player(db_session: AsyncSession):
-    rank = await _make_rank(db_session, "Member_ucfp", 2)
-    player = await _make_player(db_session, rank.id, "UnlinkPlayer_ucfp")
-    char = await _make_wow_char(db_session, "UnlinkChar_ucfp")
+async def test_unlink_character_from_player(db_session: AsyncSession, player: Player):
+    char = await _make_wow_char(db_session)
 
     await char_service.link_character_to_player(db_session, player.id, char.id)
 
@@ -132,27 +107,27 @@ async def test_unlink_character_from_player(db_session: AsyncSession):
 
 
 async def test_unlink_character_not_linked_returns_false(db_session: AsyncSession):
-    char = await _make_wow_char(db_session, "FreeChar_ucfp")
+    char = await _make_wow_char(db_session)
 
     removed = await char_service.unlink_character_from_player(db_session, char.id)
     assert removed is False
 
 
 async def test_get_wow_character_by_name(db_session: AsyncSession):
-    await _make_wow_char(db_session, "Trogmoon_gwcbn", "senjin")
+    await _make_wow_char(db_session, "Trogmoon", "senjin")
 
-    found = await char_service.get_wow_character_by_name(db_session, "Trogmoon_gwcbn", "senjin")
+    found = await char_service.get_wow_character_by_name(db_session, "Trogmoon", "senjin")
     assert found is not None
-    assert found.character_name == "Trogmoon_gwcbn"
+    assert found.character_name == "Trogmoon"
 
 
 async def test_get_wow_character_by_name_not_found(db_session: AsyncSession):
-    found = await char_service.get_wow_character_by_name(db_session, "GhostChar_nf", "senjin")
+    found = await char_service.get_wow_character_by_name(db_session, "GhostChar", "senjin")
     assert found is None
 
 
 async def test_get_wow_character_by_id(db_session: AsyncSession):
-    char = await _make_wow_char(db_session, "IdChar_gwcbi", "senjin")
+    char = await _make_wow_char(db_session, "IdChar", "senjin")
 
     found = await char_service.get_wow_character_by_id(db_session, char.id)
     assert found is not None
@@ -161,14 +136,16 @@ async def test_get_wow_character_by_id(db_session: AsyncSession):
 
 async def test_character_unique_per_player(db_session: AsyncSession):
     """A character can only be linked to one player at a time (UNIQUE on character_id)."""
-    from sqlalchemy.exc import IntegrityError
-
-    rank = await _make_rank(db_session, "Member_cupp", 2)
-    player1 = await _make_player(db_session, rank.id, "Player1_cupp")
-    player2 = await _make_player(db_session, rank.id, "Player2_cupp")
-    char = await _make_wow_char(db_session, "SharedChar_cupp")
+    rank = await _make_rank(db_session)
+    player1 = await _make_player(db_session, rank.id, "Player1")
+    player2 = await _make_player(db_session, rank.id, "Player2")
+    char = await _make_wow_char(db_session)
 
     await char_service.link_character_to_player(db_session, player1.id, char.id)
 
+    # Scope the violation to its own SAVEPOINT so the test's session stays usable.
     with pytest.raises(IntegrityError):
-        await char_service.link_character_to_player(db_session, player2.id, char.id)
+        async with db_session.begin_nested():
+            await char_service.link_character_to_player(db_session, player2.id, char.id)
+
+    assert await char_service.get_player_for_character(db_session, char.id) == player1.id
@@ -2,14 +2,13 @@
 
 import pytest
 
+from guild_portal.pages.admin_pages import _coverage_pct as pct
+
 
 # ---------------------------------------------------------------------------
-# Test the pct() helper logic inline (extracted for testability)
+# pct() — the coverage endpoint's percentage helper
 # ---------------------------------------------------------------------------
 
-def pct(matched: int, total: int) -> float:
-    return round(matched / total * 100, 1) if total else 0.0
-
 
 class TestPctHelper:
     def test_full_coverage(self):
@@ -85,12 +84,13 @@ class TestSummaryComputation:
 # ---------------------------------------------------------------------------
 
 class TestBreakdowns:
-    def test_by_link_source_sums(self):
-        total_pc = 50
-        by_source = {"note_key": 30, "exact_name": 10, "manual": 5, "unknown": 5}
-        assert sum(by_source.values()) == total_pc
-
-    def test_by_confidence_sums(self):
-        total_pc = 50
-        by_conf = {"high": 30, "medium": 10, "confirmed": 5, "unknown": 5}
-        assert sum(by_conf.values()) == total_pc
+    @pytest.mark.parametrize(
+        "breakdown",
+        [
+            {"note_key": 30, "exact_name": 10, "manual": 5, "unknown": 5},
+            {"high": 30, "medium": 10, "confirmed": 5, "unknown": 5},
+        ],
+        ids=["by_link_source", "by_confidence"],
+    )
+    def test_breakdown_sums_to_total(self, breakdown):
+        assert sum(breakdown.values()) == 50
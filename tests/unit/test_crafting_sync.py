@@ -5,6 +5,8 @@ Tests cadence computation, expansion name derivation, and season display name.
 No database required.
 """
 
+import dataclasses
+import inspect
 from datetime import datetime, timedelta, timezone
 
 import pytest
@@ -19,27 +21,30 @@ from sv_common.guild_sync.crafting_sync import (
 )
 
 
+_FROZEN_NOW = datetime(2024, 6, 1, 12, 0, tzinfo=timezone.utc)
+
+_CONFIG_TEMPLATE = CraftingSyncConfig(
+    id=1,
+    current_cadence="weekly",
+    cadence_override_until=None,
+    last_sync_at=None,
+)
+
+_SEASON_TEMPLATE = SeasonData(
+    id=1,
+    expansion_name="Khaz Algar",
+    season_number=2,
+    start_date=_FROZEN_NOW - timedelta(days=5),
+    is_new_expansion=False,
+)
+
+
 def _make_config(**kwargs) -> CraftingSyncConfig:
-    defaults = {
-        "id": 1,
-        "current_cadence": "weekly",
-        "cadence_override_until": None,
-        "last_sync_at": None,
-    }
-    defaults.update(kwargs)
-    return CraftingSyncConfig(**defaults)
+    return dataclasses.replace(_CONFIG_TEMPLATE, **kwargs)
 
 
 def _make_season(**kwargs) -> SeasonData:
-    defaults = {
-        "id": 1,
-        "expansion_name": "Khaz Algar",
-        "season_number": 2,
-        "start_date": datetime.now(timezone.utc) - timedelta(days=5),
-        "is_new_expansion": False,
-    }
-    defaults.update(kwargs)
-    return SeasonData(**defaults)
+    return dataclasses.replace(_SEASON_TEMPLATE, **kwargs)
 
 
 # ── derive_expansion_name ────────────────────────────────────────────────────
@@ -86,90 +91,105 @@ class TestDeriveExpansionName:
 class TestComputeSyncCadence:
     def test_no_season_returns_weekly(self):
         config = _make_config()
-        cadence, days = compute_sync_cadence(config, season=None)
+        cadence, days = compute_sync_cadence(config, season=None, now=_FROZEN_NOW)
         assert cadence == "weekly"
         assert days == 0
 
     def test_new_expansion_season_within_28_days_is_daily(self):
-        start = datetime.now(timezone.utc) - timedelta(days=10)
+        start = _FROZEN_NOW - timedelta(days=10)
         config = _make_config()
         season = _make_season(start_date=start, is_new_expansion=True)
-        cadence, days = compute_sync_cadence(config, season)
+        cadence, days = compute_sync_cadence(config, season, now=_FROZEN_NOW)
         assert cadence == "daily"
         assert days == 18  # 28 - 10
 
     def test_regular_season_within_14_days_is_daily(self):
-        start = datetime.now(timezone.utc) - timedelta(days=5)
+        start = _FROZEN_NOW - timedelta(days=5)
         config = _make_config()
         season = _make_season(start_date=start, is_new_expansion=False)
-        cadence, days = compute_sync_cadence(config, season)
+        cadence, days = compute_sync_cadence(config, season, now=_FROZEN_NOW)
         assert cadence == "daily"
         assert days == 9  # 14 - 5
 
     def test_new_expansion_after_28_days_is_weekly(self):
-        start = datetime.now(timezone.utc) - timedelta(days=30)
+        start = _FROZEN_NOW - timedelta(days=30)
         config = _make_config()
         season = _make_season(start_date=start, is_new_expansion=True)
-        cadence, days = compute_sync_cadence(config, season)
+        cadence, days = compute_sync_cadence(config, season, now=_FROZEN_NOW)
         assert cadence == "weekly"
         assert days == 0
 
     def test_regular_season_after_14_days_is_weekly(self):
-        start = datetime.now(timezone.utc) - timedelta(days=20)
+        start = _FROZEN_NOW - timedelta(days=20)
         config = _make_config()
         season = _make_season(start_date=start, is_new_expansion=False)
-        cadence, days = compute_sync_cadence(config, season)
+        cadence, days = compute_sync_cadence(config, season, now=_FROZEN_NOW)
         assert cadence == "weekly"
         assert days == 0
 
     def test_admin_override_takes_priority_over_season(self):
-        start = datetime.now(timezone.utc) - timedelta(days=50)
-        override_until = datetime.now(timezone.utc) + timedelta(days=3)
+        start = _FROZEN_NOW - timedelta(days=50)
+        override_until = _FROZEN_NOW + timedelta(days=3)
         config = _make_config(cadence_override_until=override_until)
         season = _make_season(start_date=start, is_new_expansion=False)
-        cadence, days = compute_sync_cadence(config, season)
+        cadence, days = compute_sync_cadence(config, season, now=_FROZEN_NOW)
         assert cadence == "daily"
-        assert days >= 2
+        assert days == 3
 
     def test_admin_override_takes_priority_when_no_season(self):
-        override_until = datetime.now(timezone.utc) + timedelta(days=5)
+        override_until = _FROZEN_NOW + timedelta(days=5)
         config = _make_config(cadence_override_until=override_until)
-        cadence, days = compute_sync_cadence(config, season=None)
+        cadence, days = compute_sync_cadence(config, season=None, now=_FROZEN_NOW)
         assert cadence == "daily"
-        assert days >= 4
+        assert days == 5
 
     def test_expired_override_falls_through_to_season(self):
-        start = datetime.now(timezone.utc) - timedelta(days=50)
-        override_until = datetime.now(timezone.utc) - timedelta(days=1)
+        start = _FROZEN_NOW - timedelta(days=50)
+        override_until = _FROZEN_NOW - timedelta(days=1)
         config = _make_config(cadence_override_until=override_until)
         season = _make_season(start_date=start)
-        cadence, _ = compute_sync_cadence(config, season)
+        cadence, _ = compute_sync_cadence(config, season, now=_FROZEN_NOW)
         assert cadence == "weekly"
 
     def test_daily_days_remaining_decreases_over_time(self):
-        start_recent = datetime.now(timezone.utc) - timedelta(days=2)
-        start_older = datetime.now(timezone.utc) - timedelta(days=10)
+        start_recent = _FROZEN_NOW - timedelta(days=2)
+        start_older = _FROZEN_NOW - timedelta(days=10)
         config = _make_config()
-        _, days_recent = compute_sync_cadence(config, _make_season(start_date=start_recent))
-        _, days_older = compute_sync_cadence(config, _make_season(start_date=start_older))
+        _, days_recent = compute_sync_cadence(
+            config, _make_season(start_date=start_recent), now=_FROZEN_NOW
+        )
+        _, days_older = compute_sync_cadence(
+            config, _make_season(start_date=start_older), now=_FROZEN_NOW
+        )
         assert days_recent > days_older
 
     def test_exactly_at_boundary_new_expansion(self):
         """Day 28 exactly should still be daily."""
-        start = datetime.now(timezone.utc) - timedelta(days=28)
+        start = _FROZEN_NOW - timedelta(days=28)
         config = _make_config()
         season = _make_season(start_date=start, is_new_expansion=True)
-        cadence, days = compute_sync_cadence(config, season)
+        cadence, days = compute_sync_cadence(config, season, now=_FROZEN_NOW)
         assert cadence == "daily"
         assert days == 0
 
     def test_day_zero_season_start(self):
         """Season just started today is daily."""
-        start = datetime.now(timezone.utc)
+        start = _FROZEN_NOW
         config = _make_config()
         season = _make_season(start_date=start)
-        cadence, _ = compute_sync_cadence(config, season)
+        cadence, _ = compute_sync_cadence(config, season, now=_FROZEN_NOW)
+        assert cadence == "daily"
+
+    def test_now_defaults_to_current_time(self):
+        start = datetime.now(timezone.utc) - timedelta(days=1)
+        cadence, days = compute_sync_cadence(_make_config(), _make_season(start_date=start))
         assert cadence == "daily"
+        assert days == 13
+
+    def test_now_is_keyword_only(self):
+        now = inspect.signature(compute_sync_cadence).parameters["now"]
+        assert now.kind is inspect.Parameter.KEYWORD_ONLY
+        assert now.default is None
 
 
 # ── get_season_display_name ──────────────────────────────────────────────────
@@ -9,51 +9,49 @@ Tests cover:
 - Scheduler no longer imports relink_note_changed_characters or calls run_matching
 """
 
+import ast
+import hashlib
 import inspect
+from types import SimpleNamespace
+
 import pytest
 
+from sv_common.db.models import Player, PlayerNoteAlias
+from sv_common.guild_sync import integrity_checker, mitigations
+from sv_common.guild_sync.rules import RULES, RuleDefinition
+from sv_common.guild_sync.integrity_checker import DETECT_FUNCTIONS, make_issue_hash
+
 
 # ---------------------------------------------------------------------------
 # Rules registry
 # ---------------------------------------------------------------------------
 
 class TestRulesRegistry:
-    def setup_method(self):
-        from sv_common.guild_sync.rules import RULES, RuleDefinition
-        self.RULES = RULES
-        self.RuleDefinition = RuleDefinition
-
     def test_all_five_rules_exist(self):
         # Phase 2.9 rules (minus note_mismatch, retired in 4.4.4) + Phase 3.0C drift rules
         expected_core = {"orphan_wow", "orphan_discord", "role_mismatch", "stale_character"}
-        assert expected_core.issubset(set(self.RULES.keys()))
+        assert expected_core.issubset(set(RULES.keys()))
 
     def test_each_rule_is_rule_definition(self):
-        for issue_type, rule in self.RULES.items():
-            assert isinstance(rule, self.RuleDefinition), f"{issue_type} is not a RuleDefinition"
-
-    def test_orphan_wow_is_manual(self):
-        rule = self.RULES["orphan_wow"]
-        assert rule.auto_mitigate is False
-        assert rule.mitigate_fn is not None
-
-    def test_orphan_discord_is_manual(self):
-        rule = self.RULES["orphan_discord"]
-        assert rule.auto_mitigate is False
-        assert rule.mitigate_fn is not None
-
-    def test_role_mismatch_is_manual(self):
-        rule = self.RULES["role_mismatch"]
-        assert rule.auto_mitigate is False
-        assert rule.mitigate_fn is not None
-
-    def test_stale_character_has_no_mitigate_fn(self):
-        rule = self.RULES["stale_character"]
-        assert rule.auto_mitigate is False
-        assert rule.mitigate_fn is None
+        for issue_type, rule in RULES.items():
+            assert isinstance(rule, RuleDefinition), f"{issue_type} is not a RuleDefinition"
+
+    @pytest.mark.parametrize(
+        "issue_type, auto_mitigate, has_mitigate_fn",
+        [
+            ("orphan_wow", False, True),
+            ("orphan_discord", False, True),
+            ("role_mismatch", False, True),
+            ("stale_character", False, False),
+        ],
+    )
+    def test_rule_flags(self, issue_type, auto_mitigate, has_mitigate_fn):
+        rule = RULES[issue_type]
+        assert rule.auto_mitigate is auto_mitigate
+        assert (rule.mitigate_fn is not None) is has_mitigate_fn
 
     def test_all_rules_have_required_fields(self):
-        for issue_type, rule in self.RULES.items():
+        for issue_type, rule in RULES.items():
             assert rule.issue_type == issue_type, f"{issue_type}: issue_type mismatch"
             assert rule.name, f"{issue_type}: empty name"
             assert rule.description, f"{issue_type}: empty description"
@@ -61,14 +59,14 @@ class TestRulesRegistry:
                 f"{issue_type}: invalid severity '{rule.severity}'"
 
     def test_all_mitigate_fns_are_async(self):
-        for issue_type, rule in self.RULES.items():
+        for issue_type, rule in RULES.items():
             if rule.mitigate_fn:
                 assert inspect.iscoroutinefunction(rule.mitigate_fn), \
                     f"{issue_type}: mitigate_fn is not async"
 
     def test_no_rules_are_auto_mitigate(self):
         # note_mismatch retired in 4.4.4 — no rules are auto_mitigate now
-        auto_rules = [k for k, v in self.RULES.items() if v.auto_mitigate]
+        auto_rules = [k for k, v in RULES.items() if v.auto_mitigate]
         assert auto_rules == [], \
             f"Expected no auto_mitigate rules, got: {auto_rules}"
 
@@ -78,63 +76,42 @@ class TestRulesRegistry:
 # ---------------------------------------------------------------------------
 
 class TestMakeIssueHash:
-    def setup_method(self):
-        from sv_common.guild_sync.integrity_checker import make_issue_hash
-        self.make_issue_hash = make_issue_hash
-
     def test_deterministic(self):
-        h1 = self.make_issue_hash("orphan_wow", 42)
-        h2 = self.make_issue_hash("orphan_wow", 42)
+        h1 = make_issue_hash("orphan_wow", 42)
+        h2 = make_issue_hash("orphan_wow", 42)
         assert h1 == h2
 
     def test_different_types_differ(self):
-        h1 = self.make_issue_hash("orphan_wow", 1)
-        h2 = self.make_issue_hash("orphan_discord", 1)
+        h1 = make_issue_hash("orphan_wow", 1)
+        h2 = make_issue_hash("orphan_discord", 1)
         assert h1 != h2
 
     def test_different_ids_differ(self):
-        h1 = self.make_issue_hash("orphan_wow", 1)
-        h2 = self.make_issue_hash("orphan_wow", 2)
+        h1 = make_issue_hash("orphan_wow", 1)
+        h2 = make_issue_hash("orphan_wow", 2)
         assert h1 != h2
 
     def test_hash_is_hex_string(self):
-        h = self.make_issue_hash("note_mismatch", 99)
+        h = make_issue_hash("note_mismatch", 99)
         assert isinstance(h, str)
         assert len(h) == 64  # sha256 hex digest
 
     def test_multiple_identifiers(self):
-        h1 = self.make_issue_hash("role_mismatch", 5, "extra")
-        h2 = self.make_issue_hash("role_mismatch", 5)
+        h1 = make_issue_hash("role_mismatch", 5, "extra")
+        h2 = make_issue_hash("role_mismatch", 5)
         assert h1 != h2
 
+    def test_hash_format_unchanged(self):
+        expected = hashlib.sha256(b"duplicate_discord:7:9").hexdigest()
+        assert make_issue_hash("duplicate_discord", 7, 9) == expected
+
 
 # ---------------------------------------------------------------------------
-# Integrity checker — detect functions exist and are async
+# Integrity checker — DETECT_FUNCTIONS registry
 # ---------------------------------------------------------------------------
 
 class TestDetectFunctions:
-    def test_detect_orphan_wow_is_async(self):
-        from sv_common.guild_sync.integrity_checker import detect_orphan_wow
-        assert inspect.iscoroutinefunction(detect_orphan_wow)
-
-    def test_detect_orphan_discord_is_async(self):
-        from sv_common.guild_sync.integrity_checker import detect_orphan_discord
-        assert inspect.iscoroutinefunction(detect_orphan_discord)
-
-    def test_detect_role_mismatch_is_async(self):
-        from sv_common.guild_sync.integrity_checker import detect_role_mismatch
-        assert inspect.iscoroutinefunction(detect_role_mismatch)
-
-    def test_detect_stale_character_is_async(self):
-        from sv_common.guild_sync.integrity_checker import detect_stale_character
-        assert inspect.iscoroutinefunction(detect_stale_character)
-
-    def test_run_integrity_check_is_async(self):
-        from sv_common.guild_sync.integrity_checker import run_integrity_check
-        assert inspect.iscoroutinefunction(run_integrity_check)
-
     def test_detect_functions_map(self):
-        from sv_common.guild_sync.integrity_checker import DETECT_FUNCTIONS
         # Should have entries for all rule types that can be individually scanned
         assert "orphan_wow" in DETECT_FUNCTIONS
         assert "orphan_discord" in DETECT_FUNCTIONS
@@ -147,59 +124,81 @@ class TestDetectFunctions:
 
 
 # ---------------------------------------------------------------------------
-# Mitigations — function signatures
+# Detect / mitigate / alias entry points are all async
 # ---------------------------------------------------------------------------
 
-class TestMitigationFunctions:
-    def test_mitigate_orphan_wow_is_async(self):
-        from sv_common.guild_sync.mitigations import mitigate_orphan_wow
-        assert inspect.iscoroutinefunction(mitigate_orphan_wow)
-
-    def test_mitigate_orphan_discord_is_async(self):
-        from sv_common.guild_sync.mitigations import mitigate_orphan_discord
-        assert inspect.iscoroutinefunction(mitigate_orphan_discord)
-
-    def test_mitigate_role_mismatch_is_async(self):
-        from sv_common.guild_sync.mitigations import mitigate_role_mismatch
-        assert inspect.iscoroutinefunction(mitigate_role_mismatch)
-
-    def test_run_auto_mitigations_is_async(self):
-        from sv_common.guild_sync.mitigations import run_auto_mitigations
-        assert inspect.iscoroutinefunction(run_auto_mitigations)
+ASYNC_SYMBOLS = [
+    (integrity_checker, name)
+    for name in (
+        "detect_orphan_wow",
+        "detect_orphan_discord",
+        "detect_role_mismatch",
+        "detect_stale_character",
+        "run_integrity_check",
+        "upsert_note_alias",
+    )
+] + [
+    (mitigations, name)
+    for name in (
+        "mitigate_orphan_wow",
+        "mitigate_orphan_discord",
+        "mitigate_role_mismatch",
+        "run_auto_mitigations",
+    )
+]
+
+
+@pytest.mark.parametrize("module, name", ASYNC_SYMBOLS)
+def test_is_async(module, name):
+    assert inspect.iscoroutinefunction(getattr(module, name))
 
 
 # ---------------------------------------------------------------------------
 # Scheduler — no longer imports relink_note_changed_characters or run_matching
 # ---------------------------------------------------------------------------
 
+_SCHEDULER_PY = "src/sv_common/guild_sync/scheduler.py"
+_DB_SYNC_PY = "src/sv_common/guild_sync/db_sync.py"
+
+
+@pytest.fixture(scope="module")
+def scheduler_symbols(src_cache) -> SimpleNamespace:
+    """Imported names and referenced identifiers in scheduler.py, parsed once.
+
+    Comments and docstrings don't count, so a mention in prose can't
+    satisfy (or fail) an import/call check.
+    """
+    tree = ast.parse(src_cache[_SCHEDULER_PY])
+    imports = {
+        alias.asname or alias.name
+        for node in ast.walk(tree)
+        if isinstance(node, (ast.Import, ast.ImportFrom))
+        for alias in node.names
+    }
+    names = {node.id for node in ast.walk(tree) if isinstance(node, ast.Name)}
+    names |= {node.attr for node in ast.walk(tree) if isinstance(node, ast.Attribute)}
+    return SimpleNamespace(imports=imports, used=imports | names)
+
+
 class TestSchedulerPipeline:
-    def test_scheduler_does_not_import_relink(self):
+    def test_scheduler_does_not_import_relink(self, scheduler_symbols):
         """run_addon_sync should not call relink_note_changed_characters."""
-        import ast
-        import pathlib
-        src = pathlib.Path("src/sv_common/guild_sync/scheduler.py").read_text(encoding="utf-8")
-        assert "relink_note_changed_characters" not in src, \
+        assert "relink_note_changed_characters" not in scheduler_symbols.used, \
             "scheduler.py still references relink_note_changed_characters"
 
-    def test_scheduler_imports_run_drift_scan(self):
+    def test_scheduler_imports_run_drift_scan(self, scheduler_symbols):
         """scheduler.py should import run_drift_scan from drift_scanner (Phase 3.0C)."""
-        import pathlib
-        src = pathlib.Path("src/sv_common/guild_sync/scheduler.py").read_text(encoding="utf-8")
-        assert "run_drift_scan" in src, \
-            "scheduler.py does not reference run_drift_scan"
+        assert "run_drift_scan" in scheduler_symbols.imports, \
+            "scheduler.py does not import run_drift_scan"
 
-    def test_scheduler_run_addon_sync_comment_mentions_no_matching(self):
+    def test_scheduler_run_addon_sync_comment_mentions_no_matching(self, src_cache):
         """run_addon_sync docstring should note that run_matching is not called."""
-        import pathlib
-        src = pathlib.Path("src/sv_common/guild_sync/scheduler.py").read_text(encoding="utf-8")
-        assert "run_matching" in src, \
+        assert "run_matching" in src_cache[_SCHEDULER_PY], \
             "scheduler.py should mention run_matching (it's still available as admin action)"
 
-    def test_db_sync_does_not_use_note_changed_ids(self):
+    def test_db_sync_does_not_use_note_changed_ids(self, src_cache):
         """sync_addon_data should not use note_changed_ids (retired)."""
-        import pathlib
-        src = pathlib.Path("src/sv_common/guild_sync/db_sync.py").read_text()
-        assert "note_changed_ids" not in src, \
+        assert "note_changed_ids" not in src_cache[_DB_SYNC_PY], \
             "db_sync.py still uses note_changed_ids"
 
 
@@ -208,11 +207,9 @@ class TestSchedulerPipeline:
 # ---------------------------------------------------------------------------
 
 class TestDbSyncStatKeys:
-    def test_sync_addon_data_stats_does_not_have_note_changed_ids(self):
+    def test_sync_addon_data_stats_does_not_have_note_changed_ids(self, src_cache):
         """Stats dict should not have the retired note_changed_ids key."""
-        import pathlib
-        src = pathlib.Path("src/sv_common/guild_sync/db_sync.py").read_text()
-        assert "note_changed_ids" not in src, \
+        assert "note_changed_ids" not in src_cache[_DB_SYNC_PY], \
             "db_sync.py should not have note_changed_ids"
 
 
@@ -223,63 +220,37 @@ class TestDbSyncStatKeys:
 class TestNoteAliases:
     def test_upsert_note_alias_is_importable(self):
         """upsert_note_alias should be importable from integrity_checker."""
-        from sv_common.guild_sync.integrity_checker import upsert_note_alias
-        assert callable(upsert_note_alias)
-
-    def test_upsert_note_alias_is_async(self):
-        import inspect
-        from sv_common.guild_sync.integrity_checker import upsert_note_alias
-        assert inspect.iscoroutinefunction(upsert_note_alias)
+        assert callable(integrity_checker.upsert_note_alias)
 
     def test_upsert_note_alias_signature(self):
-        import inspect
-        from sv_common.guild_sync.integrity_checker import upsert_note_alias
-        sig = inspect.signature(upsert_note_alias)
-        params = list(sig.parameters.keys())
-        assert "conn" in params
-        assert "player_id" in params
-        assert "alias" in params
-        assert "source" in params
-
-    def test_alias_registry_orm_model(self):
-        """PlayerNoteAlias ORM model should have correct tablename and schema."""
-        from sv_common.db.models import PlayerNoteAlias
+        params = inspect.signature(integrity_checker.upsert_note_alias).parameters
+        assert {"conn", "player_id", "alias", "source"} <= params.keys()
+
+    def test_player_note_alias_model_shape(self):
+        """PlayerNoteAlias: table name, schema and required columns."""
         assert PlayerNoteAlias.__tablename__ == "player_note_aliases"
         assert PlayerNoteAlias.__table_args__[-1]["schema"] == "guild_identity"
-
-    def test_alias_registry_orm_has_required_columns(self):
-        """PlayerNoteAlias should have id, player_id, alias, source, created_at columns."""
-        from sv_common.db.models import PlayerNoteAlias
         cols = {c.name for c in PlayerNoteAlias.__table__.columns}
-        assert "id" in cols
-        assert "player_id" in cols
-        assert "alias" in cols
-        assert "source" in cols
-        assert "created_at" in cols
+        assert {"id", "player_id", "alias", "source", "created_at"} <= cols
 
     def test_player_model_has_note_aliases_relationship(self):
         """Player model should have a note_aliases relationship."""
-        from sv_common.db.models import Player
         assert hasattr(Player, "note_aliases")
 
-    def test_mitigations_import_upsert_note_alias(self):
+    def test_mitigations_import_upsert_note_alias(self, src_cache):
         """mitigations.py should import upsert_note_alias."""
-        import pathlib
-        src = pathlib.Path("src/sv_common/guild_sync/mitigations.py").read_text()
+        src = src_cache["src/sv_common/guild_sync/mitigations.py"]
         assert "upsert_note_alias" in src, \
             "mitigations.py should use upsert_note_alias"
 
-    def test_identity_engine_import_upsert_note_alias(self):
+    def test_identity_engine_import_upsert_note_alias(self, src_cache):
         """identity_engine.py should import upsert_note_alias."""
-        import pathlib
-        src = pathlib.Path("src/sv_common/guild_sync/identity_engine.py").read_text()
+        src = src_cache["src/sv_common/guild_sync/identity_engine.py"]
         assert "upsert_note_alias" in src, \
             "identity_engine.py should use upsert_note_alias"
 
-    def test_migration_0025_exists(self):
+    def test_migration_0025_exists(self, migrations_index, src_cache):
         """Migration 0025 for player_note_aliases should exist."""
-        import pathlib
-        migrations = list(pathlib.Path("alembic/versions").glob("0025_*.py"))
+        migrations = migrations_index.get("0025", [])
         assert len(migrations) == 1, "Expected exactly one 0025_*.py migration"
-        content = migrations[0].read_text()
-        assert "player_note_aliases" in content
+        assert "player_note_aliases" in src_cache[migrations[0]]
@@ -324,6 +324,13 @@ class TestAdminPathToScreen:
 # ---------------------------------------------------------------------------
 
 
+@pytest.fixture(scope="module")
+def run_wcl_sync_src():
+    """Source of run_wcl_sync, tokenized once for the checks below."""
+    from sv_common.guild_sync.scheduler import GuildSyncScheduler
+    return inspect.getsource(GuildSyncScheduler.run_wcl_sync)
+
+
 class TestSchedulerWclSync:
     def test_run_wcl_sync_exists(self):
         from sv_common.guild_sync.scheduler import GuildSyncScheduler
@@ -344,20 +351,14 @@ class TestSchedulerWclSync:
         assert "wcl_sync" in src
         assert "run_wcl_sync" in src
 
-    def test_wcl_sync_checks_is_configured(self):
-        from sv_common.guild_sync.scheduler import GuildSyncScheduler
-        src = inspect.getsource(GuildSyncScheduler.run_wcl_sync)
-        assert "is_configured" in src
+    def test_wcl_sync_checks_is_configured(self, run_wcl_sync_src):
+        assert "is_configured" in run_wcl_sync_src
 
-    def test_wcl_sync_checks_sync_enabled(self):
-        from sv_common.guild_sync.scheduler import GuildSyncScheduler
-        src = inspect.getsource(GuildSyncScheduler.run_wcl_sync)
-        assert "sync_enabled" in src
+    def test_wcl_sync_checks_sync_enabled(self, run_wcl_sync_src):
+        assert "sync_enabled" in run_wcl_sync_src
 
-    def test_wcl_sync_decrypts_secret(self):
-        from sv_common.guild_sync.scheduler import GuildSyncScheduler
-        src = inspect.getsource(GuildSyncScheduler.run_wcl_sync)
-        assert "decrypt_secret" in src
+    def test_wcl_sync_decrypts_secret(self, run_wcl_sync_src):
+        assert "decrypt_secret" in run_wcl_sync_src
 
 
 # ---------------------------------------------------------------------------
@@ -299,22 +299,18 @@ class TestPublicIndex:
 # ---------------------------------------------------------------------------
 
 class TestMigration:
-    def test_migration_0044_exists(self):
-        import pathlib
-        migrations = list(pathlib.Path("alembic/versions").glob("0044_*.py"))
-        assert migrations, "Migration 0044 not found"
+    def test_migration_0044_exists(self, migrations_index):
+        assert migrations_index.get("0044"), "Migration 0044 not found"
 
-    def test_migration_references_quote_subjects(self):
-        import pathlib
-        migrations = list(pathlib.Path("alembic/versions").glob("0044_*.py"))
+    def test_migration_references_quote_subjects(self, migrations_index, src_cache):
+        migrations = migrations_index.get("0044")
         assert migrations
-        content = migrations[0].read_text(encoding="utf-8")
+        content = src_cache[migrations[0]]
         assert "quote_subjects" in content
         assert "subject_id" in content
 
-    def test_migration_revision_chain(self):
-        import pathlib
-        migrations = list(pathlib.Path("alembic/versions").glob("0044_*.py"))
+    def test_migration_revision_chain(self, migrations_index, src_cache):
+        migrations = migrations_index.get("0044")
         assert migrations
-        content = migrations[0].read_text(encoding="utf-8")
+        content = src_cache[migrations[0]]
         assert 'down_revision = "0043"' in content